@@ -0,0 +1,455 @@
+import hashlib
+import json
+import math
+import os
+import random
+from collections import OrderedDict
+
+import pygame as pg
+
+import config as C
+
+
+def load_gif(path, scale=1):
+    """Decodifica um GIF animado em uma lista de Surfaces RGBA."""
+    from PIL import Image  # import pesado: só quando precisa (re)gerar a sheet
+
+    gif = Image.open(path)
+    frames = []
+
+    for frame in range(gif.n_frames):
+        gif.seek(frame)
+        frame_img = gif.convert("RGBA")
+        frame_pg = pg.image.fromstring(frame_img.tobytes(), frame_img.size, "RGBA")
+
+        if scale != 1:
+            w = int(frame_pg.get_width() * scale)
+            h = int(frame_pg.get_height() * scale)
+            frame_pg = pg.transform.scale(frame_pg, (w, h))
+
+        frames.append(frame_pg)
+
+    return frames
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def sheet_paths(path, scale, cache_dir=C.CACHE_DIR):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    base = os.path.join(cache_dir, f"{stem}@{scale:g}")
+    return base + ".png", base + ".json"
+
+
+def bake_sheet(path, scale=1, cache_dir=C.CACHE_DIR):
+    """Decodifica o GIF e salva os frames lado a lado em PNG + metadados."""
+    frames = load_gif(path, scale)
+    w = sum(f.get_width() for f in frames)
+    h = max(f.get_height() for f in frames)
+    sheet = pg.Surface((w, h), pg.SRCALPHA)
+    rects = []
+    x = 0
+    for f in frames:
+        sheet.blit(f, (x, 0))
+        rects.append([x, 0, f.get_width(), f.get_height()])
+        x += f.get_width()
+
+    png, meta = sheet_paths(path, scale, cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+    pg.image.save(sheet, png)
+    with open(meta, "w") as f:
+        json.dump({"source": path, "hash": file_hash(path), "scale": scale,
+                   "frames": rects}, f)
+    return frames
+
+
+def load_frames(path, scale=1, cache_dir=C.CACHE_DIR):
+    """Frames de um GIF a partir da spritesheet no cache (gera se faltar).
+
+    A sheet vale enquanto o hash do GIF bater com o dos metadados; assim o
+    PIL só é importado na primeira execução ou quando o GIF muda.
+    """
+    png, meta = sheet_paths(path, scale, cache_dir)
+    try:
+        with open(meta) as f:
+            info = json.load(f)
+        if info["hash"] == file_hash(path):
+            sheet = pg.image.load(png)
+            return [sheet.subsurface(r) for r in info["frames"]]
+    except (OSError, ValueError, KeyError, pg.error):
+        pass
+
+    try:
+        return bake_sheet(path, scale, cache_dir)
+    except OSError as e:
+        # cache sem permissão de escrita etc.: segue sem cache
+        print(f"Falha ao salvar spritesheet de {path}: {e}")
+        return load_gif(path, scale)
+
+
+def font_path(name, cache_dir=C.CACHE_DIR):
+    """Caminho da fonte ``name`` do sistema (None = fonte padrão do pygame).
+
+    ``match_font`` varre as fontes instaladas, o que é lento em algumas
+    máquinas; o resultado fica em ``fonts.json`` no cache.
+    """
+    cache = os.path.join(cache_dir, "fonts.json")
+    try:
+        with open(cache) as f:
+            known = json.load(f)
+    except (OSError, ValueError):
+        known = {}
+
+    if name in known and (known[name] is None or os.path.exists(known[name])):
+        return known[name]
+
+    known[name] = pg.font.match_font(name)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache, "w") as f:
+            json.dump(known, f)
+    except OSError:
+        pass
+    return known[name]
+
+
+def load_font(size):
+    """Fonte do jogo: C.FONT_FILE se houver, senão C.FONT_NAME do sistema."""
+    path = C.FONT_FILE or font_path(C.FONT_NAME)
+    return pg.font.Font(path, size)
+
+
+def load_image(path, size=None):
+    """Carrega uma imagem, redimensionada para ``size`` se preciso."""
+    img = pg.image.load(path)
+    if size is not None and img.get_size() != size:
+        img = pg.transform.scale(img, size)
+    return img
+
+
+def surface_bytes(surf):
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+def rock_points(size, variant, vertices=11):
+    """Contorno irregular de asteroide; o mesmo ``variant`` dá o mesmo formato."""
+    rng = random.Random(variant)
+    pts = []
+    for i in range(vertices):
+        a = math.tau * (i + rng.uniform(-0.3, 0.3)) / vertices
+        r = (size - 1) * rng.uniform(0.7, 1.0)
+        pts.append((size + math.cos(a) * r, size + math.sin(a) * r))
+    return pts
+
+
+def render_shape(shape, color, size, level, variant=0):
+    alpha = 255 * (level + 1) // C.ALPHA_LEVELS
+    if shape == "rock":
+        # contorno fino em área quase toda vazia: colorkey + RLE é bem mais
+        # rápido de blitar que alpha por pixel
+        surf = pg.Surface((size * 2, size * 2))
+        surf.set_colorkey(C.BLACK, pg.RLEACCEL)
+        pg.draw.polygon(surf, color, rock_points(size, variant), width=1)
+        if alpha < 255:
+            surf.set_alpha(alpha, pg.RLEACCEL)
+        return surf
+
+    surf = pg.Surface((size * 2, size * 2), pg.SRCALPHA)
+    if shape == "circle":
+        pg.draw.circle(surf, (*color, alpha), (size, size), size)
+    elif shape == "square":
+        surf.fill((*color, alpha))
+    else:
+        raise ValueError(f"forma desconhecida: {shape}")
+    return surf
+
+
+class RotationAtlas:
+    """Frames pré-rotacionados em passos fixos de ângulo.
+
+    ``base_angle`` é o ângulo para onde o desenho original aponta (90 =
+    para cima). Girar vira uma consulta em tabela, sem alocar Surfaces.
+    """
+
+    def __init__(self, frames, step=5, base_angle=0):
+        self.step = step
+        self.count = max(1, int(round(360 / step)))
+        self.images = []
+        self.sizes = []
+        for frame in frames:
+            imgs = [pg.transform.rotate(frame, i * step - base_angle)
+                    for i in range(self.count)]
+            self.images.append(imgs)
+            self.sizes.append([img.get_size() for img in imgs])
+
+    def index(self, angle):
+        return int(round(angle / self.step)) % self.count
+
+    def image(self, frame, angle):
+        return self.images[frame][self.index(angle)]
+
+    def place(self, rect, frame, angle, center):
+        """Ajusta ``rect`` in-place para o frame/ângulo, centrado em ``center``."""
+        rect.size = self.sizes[frame][self.index(angle)]
+        rect.center = center
+        return rect
+
+    def convert(self, prepare):
+        """Aplica ``prepare`` (convert_alpha) a todas as imagens."""
+        self.images = [[prepare(img) for img in imgs] for imgs in self.images]
+
+    def memory(self):
+        return sum(surface_bytes(img) for imgs in self.images for img in imgs)
+
+
+class AssetCache:
+    """Cache global de assets decodificados, chaveado por (path, scale).
+
+    Cada GIF é decodificado uma única vez; todos os sprites que usam o
+    mesmo asset compartilham a mesma tupla de frames (não modifique!).
+    """
+
+    def __init__(self):
+        self.frames = {}
+        self.atlases = {}
+        self.images = {}
+        self.shapes = {}
+        self.decoded = {}  # decodificado fora da thread principal, falta converter
+        self.hits = 0
+        self.misses = 0
+
+        # frame vazio dos sprites de Worlds headless (nada é decodificado)
+        self.placeholder = None
+
+    def get_frames(self, path, scale=1, headless=False):
+        if headless:
+            if self.placeholder is None:
+                self.placeholder = (pg.Surface((32, 32), pg.SRCALPHA),)
+            return self.placeholder
+
+        key = (path, scale)
+        frames = self.frames.get(key)
+        if frames is not None:
+            self.hits += 1
+            return frames
+
+        self.misses += 1
+        frames = tuple(self._prepare(f) for f in load_frames(path, scale))
+        self.frames[key] = frames
+        return frames
+
+    def get_image(self, path, size=None):
+        """Imagem opaca (fundo), redimensionada para ``size`` se preciso."""
+        key = (path, size)
+        img = self.images.get(key)
+        if img is not None:
+            self.hits += 1
+            return img
+
+        self.misses += 1
+        img = self._prepare(load_image(path, size), alpha=False)
+        self.images[key] = img
+        return img
+
+    def get_atlas(self, path, scale=1, step=5, base_angle=0, headless=False):
+        if headless:
+            return None
+
+        key = (path, scale, step, base_angle)
+        atlas = self.atlases.get(key)
+        if atlas is not None:
+            self.hits += 1
+            return atlas
+
+        self.misses += 1
+        atlas = RotationAtlas(self.get_frames(path, scale), step, base_angle)
+        self.atlases[key] = atlas
+        return atlas
+
+    def get_shape(self, shape, color, size, level=None, variant=0):
+        """Surface imutável de uma forma simples (bala, partícula, asteroide...).
+
+        As Surfaces são compartilhadas: nunca chame set_alpha/fill nelas,
+        peça outro ``level`` de transparência.
+        """
+        if level is None:
+            level = C.ALPHA_LEVELS - 1
+        key = (shape, color, size, level, variant)
+        surf = self.shapes.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = render_shape(shape, color, size, level, variant)
+        surf = self._prepare(surf, alpha=surf.get_flags() & pg.SRCALPHA)
+        self.shapes[key] = surf
+        return surf
+
+    def _prepare(self, surf, alpha=True):
+        # convert_alpha só funciona depois de pg.display.set_mode
+        if pg.display.get_surface() is not None:
+            return surf.convert_alpha() if alpha else surf.convert()
+        return surf
+
+    # ------------------------------------------------------------------
+    # Carregamento em segundo plano (ver loader.py): os decode_* rodam em
+    # outra thread e só decodificam; finalize() converte na thread principal
+    # ------------------------------------------------------------------
+    def decode_frames(self, path, scale=1):
+        key = ("frames", path, scale)
+        if key not in self.decoded:
+            self.decoded[key] = load_frames(path, scale)
+        return self.decoded[key]
+
+    def decode_atlas(self, path, scale=1, step=5, base_angle=0):
+        frames = self.decode_frames(path, scale)
+        self.decoded[("atlas", path, scale, step, base_angle)] = \
+            RotationAtlas(frames, step, base_angle)
+
+    def decode_image(self, path, size=None):
+        self.decoded[("image", path, size)] = load_image(path, size)
+
+    def finalize(self):
+        """Converte o que foi decodificado em segundo plano e põe nos caches."""
+        while self.decoded:
+            (kind, *key), item = self.decoded.popitem()
+            key = tuple(key)
+            if kind == "frames":
+                self.frames[key] = tuple(self._prepare(f) for f in item)
+            elif kind == "atlas":
+                item.convert(self._prepare)
+                self.atlases[key] = item
+            elif kind == "image":
+                self.images[key] = self._prepare(item, alpha=False)
+
+    def preload(self, *items):
+        """Decodifica antecipadamente. Itens: path ou (path, scale)."""
+        for item in items:
+            if isinstance(item, tuple):
+                self.get_frames(*item)
+            else:
+                self.get_frames(item)
+
+    def evict(self, path=None, scale=None):
+        """Remove entradas do cache. Sem argumentos, limpa tudo.
+
+        ``scale`` só filtra frames e atlas; imagens são chaveadas por tamanho.
+        """
+        def matches(key_path, key_scale):
+            return ((path is None or key_path == path)
+                    and (scale is None or key_scale == scale))
+
+        for table in (self.frames, self.atlases):
+            for key in list(table):
+                if matches(key[0], key[1]):
+                    del table[key]
+        for key in list(self.images):
+            if matches(key[0], scale):
+                del self.images[key]
+        # decodificados ainda não convertidos: (tipo, path, scale ou size, ...)
+        for key in list(self.decoded):
+            if matches(key[1], scale if key[0] == "image" else key[2]):
+                del self.decoded[key]
+
+    def memory(self):
+        total = sum(surface_bytes(f) for frames in self.frames.values() for f in frames)
+        total += sum(surface_bytes(s) for s in self.shapes.values())
+        total += sum(surface_bytes(s) for s in self.images.values())
+        return total + sum(a.memory() for a in self.atlases.values())
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": (len(self.frames) + len(self.atlases) + len(self.shapes)
+                        + len(self.images)),
+            "bytes": self.memory(),
+        }
+
+
+ASSETS = AssetCache()
+
+
+class GlyphAtlas:
+    """Uma Surface com todos os ``chars`` lado a lado, em largura fixa.
+
+    Números são desenhados com um ``blits`` de recortes do atlas, sem
+    chamar ``font.render`` quando o valor muda.
+    """
+
+    def __init__(self, font, color=C.WHITE, chars="0123456789-"):
+        glyphs = [font.render(ch, True, color) for ch in chars]
+        self.advance = max(g.get_width() for g in glyphs)
+        self.height = max(g.get_height() for g in glyphs)
+        self.image = pg.Surface((self.advance * len(chars), self.height), pg.SRCALPHA)
+        self.areas = {}
+        for i, (ch, g) in enumerate(zip(chars, glyphs)):
+            x = i * self.advance
+            self.image.blit(g, (x, 0))
+            self.areas[ch] = pg.Rect(x, 0, self.advance, self.height)
+
+    def draw(self, surf, s, pos):
+        """Desenha ``s`` (só caracteres do atlas) em ``pos``; retorna o Rect."""
+        x, y = pos
+        adv = self.advance
+        image, areas = self.image, self.areas
+        surf.blits([(image, (x + i * adv, y), areas[ch]) for i, ch in enumerate(s)],
+                   doreturn=False)
+        return pg.Rect(x, y, adv * len(s), self.height)
+
+
+class TextCache:
+    """Textos já renderizados, chaveados por (fonte, texto, cor).
+
+    Só chama ``font.render`` quando o conteúdo muda; as entradas menos
+    usadas saem quando passam de ``capacity``.
+    """
+
+    def __init__(self, capacity=C.TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        self.labels = OrderedDict()
+        self.atlases = {}
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, s, color=C.WHITE):
+        key = (font, s, color)
+        label = self.labels.get(key)
+        if label is not None:
+            self.hits += 1
+            self.labels.move_to_end(key)
+            return label
+
+        self.misses += 1
+        label = font.render(s, True, color)
+        self.labels[key] = label
+        if len(self.labels) > self.capacity:
+            self.labels.popitem(last=False)
+        return label
+
+    def draw(self, surf, font, s, pos, color=C.WHITE):
+        return surf.blit(self.render(font, s, color), pos)
+
+    def glyphs(self, font, color=C.WHITE):
+        key = (font, color)
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = self.atlases[key] = GlyphAtlas(font, color)
+        return atlas
+
+    def draw_number(self, surf, font, value, pos, digits=0, color=C.WHITE):
+        """Inteiro com zeros à esquerda até ``digits``, via atlas de dígitos."""
+        return self.glyphs(font, color).draw(surf, f"{value:0{digits}d}", pos)
+
+    def clear(self):
+        self.labels.clear()
+        self.atlases.clear()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.labels)}
+
+
+TEXT = TextCache()
@@ -0,0 +1,113 @@
+import math
+
+import numpy as np
+
+import config as C
+from assets import ASSETS
+from pool import Pool
+
+# classes de tamanho na ordem de config.AST_SIZES (maior primeiro)
+SIZES = list(C.AST_SIZES)
+RADIUS = np.array([C.AST_SIZES[s]["r"] for s in SIZES], np.float32)
+SCORE = np.array([C.AST_SIZES[s]["score"] for s in SIZES], np.int64)
+SPLIT = [[SIZES.index(c) for c in C.AST_SIZES[s]["split"]] for s in SIZES]
+COLOR = (200, 200, 200)
+GRID_CATEGORY = "asteroid"
+
+
+class AsteroidField(Pool):
+    """Asteroides num pool de capacidade fixa.
+
+    Movimento e wrap são feitos em lote, e as colisões passam pela
+    SpatialHash do World; dividir um asteroide só ocupa linhas livres do
+    pool. Cada (tamanho, variante) tem um contorno pré-desenhado em
+    ``ASSETS``, então desenhar é um único ``blits``.
+    """
+
+    fields = ("pos", "vel", "size", "variant")
+
+    def __init__(self, capacity=C.AST_POOL, rng=None):
+        super().__init__(capacity)
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.size = np.zeros(capacity, np.intp)     # índice em SIZES
+        self.variant = np.zeros(capacity, np.intp)
+
+        self.table = np.empty((len(SIZES), C.AST_VARIANTS), object)
+        for s in range(len(SIZES)):
+            for v in range(C.AST_VARIANTS):
+                self.table[s, v] = ASSETS.get_shape("rock", COLOR, int(RADIUS[s]), variant=v)
+
+    def random_vel(self, n):
+        angle = self.rng.uniform(0, math.tau, n)
+        speed = self.rng.uniform(C.AST_VEL_MIN, C.AST_VEL_MAX, n)
+        return np.stack([np.cos(angle), np.sin(angle)], axis=1) * speed[:, None]
+
+    def spawn_many(self, pos, size):
+        """Asteroides em ``pos`` (Nx2), direção aleatória. Retorna quantos couberam."""
+        sl = self.alloc(len(pos))
+        n = sl.stop - sl.start
+        if n == 0:
+            return 0
+
+        self.pos[sl] = pos[:n]
+        self.vel[sl] = self.random_vel(n)
+        self.size[sl] = size if np.isscalar(size) else size[:n]
+        self.variant[sl] = self.rng.integers(0, C.AST_VARIANTS, n)
+        return n
+
+    def update(self, dt):
+        if self.count:
+            self.move(dt)
+
+    def index(self, grid):
+        """Coloca os asteroides vivos na grade (refazer depois de ``split``)."""
+        n = self.count
+        grid.index(GRID_CATEGORY, self.pos[:n], RADIUS[self.size[:n]])
+
+    def hits(self, grid, points, r):
+        """Primeiro asteroide atingido por cada ponto (Nx2, raio ``r``).
+
+        Usa o que ``index`` colocou na grade. Retorna (índices dos pontos,
+        índices dos asteroides).
+        """
+        point, rock = grid.query(GRID_CATEGORY, points, r)
+        if len(point) == 0:
+            return point, rock
+        # o de menor índice, para não depender da ordem das células
+        order = np.lexsort((rock, point))
+        point, rock = point[order], rock[order]
+        first = np.flatnonzero(np.diff(point, prepend=-1))
+        return point[first], rock[first]
+
+    def split(self, indices):
+        """Destroi os asteroides dados; os filhos (AST_SIZES) nascem no lugar.
+
+        Retorna (posições, tamanhos) dos destruídos, para pontuação/efeitos.
+        """
+        indices = np.unique(np.asarray(indices, np.intp))
+        if len(indices) == 0:
+            return np.empty((0, 2), np.float32), np.empty(0, np.intp)
+
+        pos = self.pos[indices].copy()
+        size = self.size[indices].copy()
+
+        child_pos, child_size = [], []
+        for s, children in enumerate(SPLIT):
+            parents = pos[size == s]
+            for c in children:
+                child_pos.append(parents)
+                child_size.append(np.full(len(parents), c, np.intp))
+
+        self.kill(indices)
+        if child_pos:
+            self.spawn_many(np.concatenate(child_pos), np.concatenate(child_size))
+        return pos, size
+
+    def blits(self, lag):
+        n = self.count
+        size = self.size[:n]
+        images = self.table[size, self.variant[:n]]
+        return images, self.pos[:n] - self.vel[:n] * lag - RADIUS[size][:, None]
@@ -0,0 +1,175 @@
+"""Simulação em lote para balancear as waves.
+
+Roda milhares de partidas headless independentes (seed = --seed + i) em
+todos os núcleos, cada uma jogada por um piloto automático, e grava um
+JSON por partida assim que ela termina. No fim junta tudo num resumo.
+
+Uso:
+    python balance.py --games 2000 --pilot scripted --out runs.jsonl
+    python balance.py --games 500 --set UFO_SPEED_STEP=0.1 --set UFO_RELOAD_MIN=0.5
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+from collections import defaultdict
+from multiprocessing import Pool
+
+import config as C
+
+
+def apply_overrides(overrides):
+    for name, value in overrides.items():
+        if not hasattr(C, name):
+            raise SystemExit(f"config.{name} não existe")
+        setattr(C, name, value)
+
+
+def play(task):
+    """Uma partida completa; roda dentro de um processo do pool."""
+    from sim import HeadlessGame, PILOTS
+    from systems import World
+
+    seed, pilot_name, max_steps = task
+    game = HeadlessGame()
+    world = World(game, headless=True, seed=seed)
+    pilot = PILOTS[pilot_name](seed)
+    dt = 1 / C.SIM_HZ
+    clock = time.perf_counter
+
+    waves = []
+    cur = {"wave": world.wave, "steps": 0, "cost": 0.0, "max_ufos": 0,
+           "score_start": 0, "deaths": 0}
+    lives = world.lives
+
+    step = 0
+    while step < max_steps and game.scene.name == "play":
+        t = clock()
+        world.step(dt, pilot(world))
+        cur["cost"] += clock() - t
+        cur["steps"] += 1
+        cur["max_ufos"] = max(cur["max_ufos"], len(world.ufos))
+        if world.lives != lives:
+            cur["deaths"] += lives - world.lives
+            lives = world.lives
+        step += 1
+
+        if world.wave != cur["wave"]:
+            waves.append(close_wave(cur, world.score, dt))
+            cur = {"wave": world.wave, "steps": 0, "cost": 0.0, "max_ufos": 0,
+                   "score_start": world.score, "deaths": 0}
+    waves.append(close_wave(cur, world.score, dt))
+
+    return {
+        "seed": seed,
+        "pilot": pilot_name,
+        "steps": step,
+        "survival_s": step * dt,
+        "game_over": game.scene.name != "play",
+        "score": world.score,
+        "wave": world.wave,
+        "waves": waves,
+    }
+
+
+def close_wave(cur, score, dt):
+    return {
+        "wave": cur["wave"],
+        "survival_s": cur["steps"] * dt,
+        "score": score - cur["score_start"],
+        "max_ufos": cur["max_ufos"],
+        "deaths": cur["deaths"],
+        "step_ms": cur["cost"] * 1000 / max(1, cur["steps"]),
+    }
+
+
+def summarize(results):
+    """Estatísticas gerais e por wave a partir dos resultados por partida."""
+    def stats(values):
+        if not values:
+            return None
+        values = sorted(values)
+        return {
+            "mean": statistics.fmean(values),
+            "median": statistics.median(values),
+            "p10": values[len(values) // 10],
+            "p90": values[(len(values) * 9) // 10],
+            "max": values[-1],
+        }
+
+    per_wave = defaultdict(lambda: defaultdict(list))
+    for r in results:
+        for w in r["waves"]:
+            for key in ("survival_s", "score", "max_ufos", "deaths", "step_ms"):
+                per_wave[w["wave"]][key].append(w[key])
+
+    return {
+        "games": len(results),
+        "score": stats([r["score"] for r in results]),
+        "survival_s": stats([r["survival_s"] for r in results]),
+        "final_wave": stats([r["wave"] for r in results]),
+        "waves": {
+            wave: {"reached": len(vals["survival_s"]),
+                   **{key: stats(v) for key, v in vals.items()}}
+            for wave, vals in sorted(per_wave.items())
+        },
+    }
+
+
+def parse_override(text):
+    name, _, value = text.partition("=")
+    try:
+        return name, json.loads(value)
+    except ValueError:
+        return name, value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulação em lote para balancear as waves")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0, help="seed da primeira partida")
+    parser.add_argument("--pilot", default="scripted", choices=["idle", "random", "scripted"])
+    parser.add_argument("--minutes", type=float, default=10.0,
+                        help="duração máxima de cada partida (tempo de jogo)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--set", dest="overrides", action="append", default=[],
+                        type=parse_override, metavar="NOME=VALOR",
+                        help="sobrescreve uma constante de config.py")
+    parser.add_argument("--out", default="balance_runs.jsonl",
+                        help="um JSON por partida, escrito conforme terminam")
+    parser.add_argument("--summary", default="balance_summary.json")
+    args = parser.parse_args(argv)
+
+    overrides = dict(args.overrides)
+    apply_overrides(overrides)
+
+    max_steps = int(args.minutes * 60 * C.SIM_HZ)
+    tasks = [(args.seed + i, args.pilot, max_steps) for i in range(args.games)]
+    chunk = max(1, min(16, args.games // (args.workers * 8)))
+
+    results = []
+    start = time.perf_counter()
+    with open(args.out, "w") as out, \
+            Pool(args.workers, initializer=apply_overrides, initargs=(overrides,)) as pool:
+        for i, res in enumerate(pool.imap_unordered(play, tasks, chunksize=chunk), 1):
+            out.write(json.dumps(res) + "\n")
+            out.flush()
+            results.append(res)
+            if i % 100 == 0 or i == args.games:
+                secs = time.perf_counter() - start
+                print(f"{i}/{args.games} partidas  {i / secs:.1f} partidas/s")
+
+    summary = summarize(results)
+    summary["config"] = {"pilot": args.pilot, "minutes": args.minutes,
+                         "workers": args.workers, "overrides": overrides}
+    with open(args.summary, "w") as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"score médio {summary['score']['mean']:.0f}  "
+          f"wave final mediana {summary['final_wave']['median']}  "
+          f"sobrevivência média {summary['survival_s']['mean']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
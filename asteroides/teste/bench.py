@@ -0,0 +1,295 @@
+"""Benchmarks do loop de jogo.
+
+Uso:
+    python bench.py                       # todos os cenários, headless
+    python bench.py ufo_swarm --steps 5000
+    python bench.py --render --out atual.json --baseline base.json
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import config as C
+from utils import Vec
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+SCENARIOS = {}
+
+
+def scenario(name):
+    def register(fn):
+        SCENARIOS[name] = fn
+        return fn
+    return register
+
+
+# ------------------------------------------------------------------
+# Cenários: recebem o World, um RNG e o total de passos e devolvem a
+# função chamada a cada passo
+# ------------------------------------------------------------------
+@scenario("ufo_swarm")
+def ufo_swarm(world, rng, steps, ufos=200):
+    """N UFOs perseguindo (e atirando na) nave."""
+    for _ in range(ufos):
+        world.spawn_ufo()
+    return lambda step: None
+
+
+@scenario("bullet_field")
+def bullet_field(world, rng, steps):
+    """Pool de tiros sempre cheio, reabastecido a cada passo."""
+    pool = world.bullets
+
+    def refill(step):
+        n = pool.capacity - pool.count
+        if n:
+            pos = rng.uniform(0, 1, (n, 2)) * (C.WIDTH, C.HEIGHT)
+            ang = rng.uniform(0, math.tau, n)
+            vel = np.stack([np.cos(ang), np.sin(ang)], axis=1) * C.UFO_BULLET_SPEED
+            pool.spawn_many(pos, vel, rng.integers(0, 2))
+    for _ in range(10):
+        world.spawn_ufo()
+    refill(0)
+    return refill
+
+
+@scenario("explosions")
+def explosions(world, rng, steps, every=6, amount=200):
+    """Rajadas repetidas de spawn_explosion."""
+    def burst(step):
+        if step % every == 0:
+            pos = Vec(rng.uniform(0, C.WIDTH), rng.uniform(0, C.HEIGHT))
+            world.spawn_explosion(pos, amount)
+    return burst
+
+
+@scenario("waves")
+def waves(world, rng, steps, last_wave=30):
+    """Progressão da wave 1 até a 30 via start_next_wave, ao longo do cenário."""
+    every = max(1, steps // last_wave)
+
+    def advance(step):
+        if world.wave < last_wave and step % every == 0:
+            world.start_next_wave()
+    return advance
+
+
+@scenario("asteroid_field")
+def asteroid_field(world, rng, steps, rocks=3000, shots=64):
+    """Milhares de asteroides sob fogo contínuo (divisões a cada passo)."""
+    field = world.asteroids
+
+    def refill(step):
+        n = rocks - field.count
+        if n > 0:
+            pos = rng.uniform(0, 1, (n, 2)) * (C.WIDTH, C.HEIGHT)
+            field.spawn_many(pos, rng.integers(0, 3, n))
+        n = shots - world.bullets.count
+        if n > 0:
+            pos = rng.uniform(0, 1, (n, 2)) * (C.WIDTH, C.HEIGHT)
+            ang = rng.uniform(0, math.tau, n)
+            vel = np.stack([np.cos(ang), np.sin(ang)], axis=1) * C.SHIP_BULLET_SPEED
+            world.bullets.spawn_many(pos, vel, 0)
+    refill(0)
+    return refill
+
+
+@scenario("render")
+def render(world, rng, steps, ufos=60):
+    """Só World.draw (sem update), com o mundo povoado."""
+    for _ in range(ufos):
+        world.spawn_ufo()
+    bullet_field(world, rng, steps)(0)
+    for _ in range(5):
+        world.spawn_explosion(world.ship.pos, 200)
+    return None  # sinaliza: não chamar update
+
+
+# ------------------------------------------------------------------
+# Execução
+# ------------------------------------------------------------------
+def make_world(render):
+    from sim import HeadlessGame
+    from systems import World
+
+    if not render:
+        return World(HeadlessGame(), headless=True), None, None
+
+    # render em superfície offscreen (driver dummy, sem janela de verdade)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame as pg
+    pg.display.init()
+    pg.font.init()
+    screen = pg.display.set_mode((C.WIDTH, C.HEIGHT))
+    return World(HeadlessGame()), screen, pg.font.Font(None, 20)
+
+
+def percentile(values, p):
+    return float(np.percentile(values, p)) if len(values) else 0.0
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta em KB, macOS em bytes
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def run_scenario(name, steps=2000, render=False, seed=1, trace_memory=False):
+    from profiler import FrameProfiler
+    from inputs import NO_INPUT
+
+    rng = np.random.default_rng(seed)
+    world, screen, font = make_world(render)
+    world.safe = math.inf  # nave invulnerável: o cenário nunca termina
+    per_step = SCENARIOS[name](world, rng, steps)
+
+    prof = FrameProfiler()
+    world.profiler = prof
+    dt = 1 / C.SIM_HZ
+
+    if trace_memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    for step in range(steps):
+        prof.begin()
+        if per_step is not None:
+            per_step(step)
+            prof.mark("scenario")
+            world.update(dt, NO_INPUT)
+        if screen is not None:
+            world.draw(screen, font)
+            prof.mark("draw")
+        prof.end()
+    elapsed = time.perf_counter() - start
+
+    peak_traced = None
+    if trace_memory:
+        peak_traced = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+
+    frame_ms = [total * 1000 for total, _, _ in prof.frames]
+    return {
+        "steps": steps,
+        "render": render,
+        "seconds": elapsed,
+        "fps": steps / elapsed if elapsed else 0.0,
+        "frame_ms": {
+            "mean": float(np.mean(frame_ms)),
+            "p50": percentile(frame_ms, 50),
+            "p95": percentile(frame_ms, 95),
+            "p99": percentile(frame_ms, 99),
+        },
+        "subsystems_ms": prof.summary(),
+        # taxa real de cada subsistema do World (Scheduler), por s simulado
+        "subsystem_rates": world.scheduler.report(steps * dt),
+        "entities": {
+            "ufos": len(world.ufos),
+            "bullets": len(world.bullets),
+            "particles": len(world.particles),
+        },
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_traced_mb": peak_traced,
+    }
+
+
+def run_isolated(*args):
+    """``run_scenario`` num processo novo, para ``peak_rss_mb`` ser só do cenário
+    (ru_maxrss é o pico do processo inteiro)."""
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(run_scenario, args)
+
+
+def compare(results, baseline, tolerance):
+    """Imprime a variação contra a baseline; retorna os cenários que pioraram."""
+    worse = []
+    for name, res in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            print(f"{name:14s} (sem baseline)")
+            continue
+        ratio = res["frame_ms"]["p95"] / max(base["frame_ms"]["p95"], 1e-9)
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  <-- REGRESSÃO"
+            worse.append(name)
+        print(f"{name:14s} p95 {base['frame_ms']['p95']:.3f} -> "
+              f"{res['frame_ms']['p95']:.3f} ms ({(ratio - 1) * 100:+.1f}%){flag}")
+    return worse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks do loop de jogo")
+    parser.add_argument("scenarios", nargs="*",
+                        help=f"cenários a rodar (padrão: todos): {', '.join(SCENARIOS)}")
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--render", action="store_true",
+                        help="desenha cada passo numa superfície offscreen")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="mede pico de alocações com tracemalloc (mais lento)")
+    parser.add_argument("--out", help="arquivo JSON com os resultados")
+    parser.add_argument("--baseline", help="JSON de uma execução anterior para comparar")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="piora relativa do p95 aceita antes de falhar")
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"cenário desconhecido: {', '.join(unknown)}")
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "steps": args.steps,
+            "seed": args.seed,
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "scenarios": {},
+    }
+
+    for name in names:
+        # render é sempre com superfície; os outros só se --render
+        render = args.render or name == "render"
+        res = run_isolated(name, args.steps, render, args.seed, args.trace_memory)
+        results["scenarios"][name] = res
+        subs = "  ".join(f"{k} {v:.3f}" for k, v in res["subsystems_ms"].items())
+        print(f"{name:14s} {res['fps']:9.0f} passos/s  p50 {res['frame_ms']['p50']:.3f}  "
+              f"p95 {res['frame_ms']['p95']:.3f}  p99 {res['frame_ms']['p99']:.3f} ms")
+        print(f"{'':14s} {subs}")
+        rates = "  ".join(f"{k} {r['calls_per_s']:.1f}/{r['hz']:g} Hz"
+                          for k, r in res["subsystem_rates"].items()
+                          if r["hz"] and r["calls_per_s"])
+        if rates:
+            print(f"{'':14s} {rates}")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
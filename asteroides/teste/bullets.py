@@ -0,0 +1,67 @@
+import numpy as np
+
+import config as C
+from assets import ASSETS
+from pool import Pool
+
+OWNER_SHIP = 0
+OWNER_UFO = 1
+
+# branco para nave, vermelho para UFO
+COLORS = {
+    OWNER_SHIP: (255, 255, 255),
+    OWNER_UFO: (255, 100, 100),
+}
+
+
+class BulletPool(Pool):
+    """Tiros da nave e dos UFOs.
+
+    Cada tiro é só uma linha nos arrays: disparar não aloca objetos e a
+    expiração/remoção compacta os arrays em lote.
+    """
+
+    fields = ("pos", "vel", "age", "owner")
+
+    def __init__(self, capacity=C.BULLET_POOL, lifetime=C.BULLET_TTL):
+        super().__init__(capacity)
+        self.lifetime = lifetime
+
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.age = np.zeros(capacity, np.float32)
+        self.owner = np.zeros(capacity, np.int8)
+
+        self.images = [ASSETS.get_shape("circle", COLORS[o], C.BULLET_RADIUS)
+                       for o in (OWNER_SHIP, OWNER_UFO)]
+
+    def count_owner(self, owner):
+        return int(np.count_nonzero(self.owner[:self.count] == owner))
+
+    def spawn(self, pos, vel, owner):
+        """Adiciona um tiro. Retorna False se o pool estiver cheio."""
+        return self.spawn_many(np.reshape(pos, (1, 2)), np.reshape(vel, (1, 2)), owner) == 1
+
+    def spawn_many(self, pos, vel, owner):
+        """Adiciona vários tiros de uma vez (arrays Nx2). Retorna quantos couberam."""
+        sl = self.alloc(len(pos))
+        n = sl.stop - sl.start
+        self.pos[sl] = pos[:n]
+        self.vel[sl] = vel[:n]
+        self.age[sl] = 0.0
+        self.owner[sl] = owner
+        return n
+
+    def update(self, dt):
+        if self.count == 0:
+            return
+        self.move(dt)
+        n = self.count
+        self.age[:n] += dt
+        self.remove(self.age[:n] >= self.lifetime)
+
+    def blits(self, lag):
+        n = self.count
+        pos = np.mod(self.pos[:n] - self.vel[:n] * lag, self.bounds)
+        images = self.images
+        return [images[o] for o in self.owner[:n].tolist()], pos - C.BULLET_RADIUS
@@ -2,20 +2,28 @@
 WIDTH = 960
 HEIGHT = 720
 FPS = 60
+SIM_HZ = 120        # passos fixos de simulação por segundo
+MAX_SIM_STEPS = 5   # máximo de passos por frame (evita a espiral da morte)
 
 # Jogo
 START_LIVES = 3
 SAFE_SPAWN_TIME = 2.0  # s de invulnerabilidade ao renascer
 WAVE_DELAY = 2.0       # s entre ondas
+WAVE_BREAK = 4.0       # s sem inimigos antes da próxima wave
 
 # Nave
 SHIP_RADIUS = 15
-SHIP_TURN_SPEED = 220.0  # deg/s
-SHIP_THRUST = 220.0      # px/s^2
-SHIP_FRICTION = 0.995
+SHIP_TURN_SPEED = 180.0  # deg/s
+SHIP_THRUST = 200.0      # px/s^2
+SHIP_MAX_SPEED = 300.0   # px/s
+SHIP_FRICTION = 0.98     # fator da velocidade a cada 1/60 s (1/FPS)
+SHIP_MUZZLE = 20.0       # px à frente da nave onde o tiro nasce
 SHIP_FIRE_RATE = 0.2     # s entre tiros
 SHIP_BULLET_SPEED = 420.0
 HYPERSPACE_COST = 250    # pontos negativos
+HYPERSPACE_COOLDOWN = 10.0  # s entre saltos
+HYPERSPACE_INVULN = 1.0     # s de invulnerabilidade depois do salto
+SHIP_ROT_STEP = 5.0      # graus entre frames do atlas de rotação
 
 # Asteroides
 AST_VEL_MIN = 30.0
@@ -25,22 +33,85 @@ AST_SIZES = {
     "M": {"r": 24, "score": 50, "split": ["S", "S"]},
     "S": {"r": 12, "score": 100, "split": []},
 }
+AST_POOL = 8192        # capacidade do pool (inclui os pedaços das divisões)
+AST_VARIANTS = 4       # contornos diferentes por tamanho
+AST_WAVE_START = 4     # asteroides grandes na wave 1
+AST_WAVE_STEP = 1      # + por wave
 
 # Tiro
 BULLET_RADIUS = 2
-BULLET_TTL = 1.0
-MAX_BULLETS = 4
+BULLET_TTL = 2.0
+MAX_BULLETS = 4          # tiros simultâneos do jogador
+BULLET_POOL = 1024       # capacidade total (nave + UFOs)
+
+# Efeitos
+ALPHA_LEVELS = 16  # níveis de transparência pré-gerados para fade-out
+MAX_PARTICLES = 16384  # limite rígido de partículas vivas
 
 # UFO
 UFO_SPAWN_EVERY = 15.0  # segundos
 UFO_SPEED = 80.0
+UFO_BULLET_SPEED = 500.0
 UFO_BIG = {"r": 18, "score": 200, "aim": 0.2}
 UFO_SMALL = {"r": 12, "score": 1000, "aim": 0.6}
 
+# Dificuldade por wave (ver balance.py para testar ajustes)
+UFO_SPAWN_RATE = 0.015       # chance de spawn extra quando o timer zera
+UFO_SPAWN_RATE_STEP = 0.006  # + por wave
+UFO_SPEED_STEP = 0.15        # + no multiplicador de velocidade por wave
+UFO_RELOAD_BASE = 1.4        # s entre tiros de cada UFO na wave 0
+UFO_RELOAD_STEP = 0.1        # - por wave
+UFO_RELOAD_MIN = 0.35
+
 # Cores (R, G, B)
 WHITE = (240, 240, 240)
 GRAY = (120, 120, 120)
 BLACK = (0, 0, 0)
 
+# Taxa (Hz) dos subsistemas do World.update; os ausentes rodam em todo
+# passo (SIM_HZ): ship, physics, ufo_shots, collisions
+SUBSYSTEM_HZ = {
+    "animation": 12,
+    "ufo_ai": 20,
+    "waves": 10,
+}
+
+# Profiler (F1 liga/desliga durante o jogo)
+PROFILER = False
+PROFILER_HISTORY = 120          # frames no gráfico da tela
+PROFILER_KEEP = 36000           # frames guardados para exportar (~10 min)
+PROFILER_EXPORT = "profile.csv"  # .csv ou .json, salvo ao sair
+
+# Render
+TEXT_CACHE_SIZE = 64   # textos renderizados guardados (LRU)
+DIRTY_RECTS = False    # renderização por retângulos sujos (ver render.py)
+DIRTY_MAX_AREA = 0.4   # fração da tela acima da qual vale mais o flip completo
+DIRTY_MAX_RECTS = 400
+
+# Qualidade adaptativa (ver quality.py): limiares em múltiplos do orçamento do frame
+QUALITY_GOVERNOR = True
+QUALITY_EMA = 0.1          # peso do frame novo na média móvel
+QUALITY_HIGH = 1.05        # acima disso por QUALITY_DOWN_FRAMES: desce um nível
+QUALITY_LOW = 0.7          # abaixo disso por QUALITY_UP_FRAMES: sobe um nível
+QUALITY_DOWN_FRAMES = 15
+QUALITY_UP_FRAMES = 180
+
+# Cache em disco: spritesheets (GIF -> PNG + JSON, refeitas se o GIF mudar)
+# e o caminho das fontes do sistema já resolvidas
+CACHE_DIR = "assets/.cache"
+
+# Fonte do HUD/menu: um TTF embutido é carregado direto; senão procura
+# FONT_NAME no sistema (busca lenta, feita uma vez e guardada no cache)
+FONT_FILE = None
+FONT_NAME = "consolas"
+
+# Snapshots (ver snapshot.py): rewind segurando BACKSPACE, F5 salva, F9 carrega
+REWIND = True                    # grava um snapshot por frame (etapa "snapshot" do profiler)
+REWIND_SECONDS = 10
+REWIND_BYTES = 32 * 1024 * 1024  # memória fixa do buffer de rewind
+REWIND_KEYFRAME = 30             # 1 snapshot inteiro a cada N; o resto é delta
+QUICKSAVE_FILE = "quicksave.snap"
+CRASH_DUMP_FILE = "crash.snap"
+
 # Aleatoriedade
 RANDOM_SEED = None  # ou defina um int para reprodutibilidade
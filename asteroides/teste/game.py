@@ -1,13 +1,18 @@
-import random
 import sys
 from dataclasses import dataclass
 
 import pygame as pg
 from sound import SoundManager
 import config as C
-from systems import World
+from assets import ASSETS, load_font
+from inputs import InputFrame
+from loader import AssetLoader, game_assets
+from quality import QualityGovernor
 from utils import text
 
+# profiler, render, replay e systems (numpy) são importados só quando usados:
+# o menu precisa aparecer o quanto antes
+
 
 @dataclass
 class Scene:
@@ -15,8 +20,16 @@ class Scene:
 
 
 class Game:
-    def __init__(self):
-        pg.init()
+    def __init__(self, seed=None, record=None, replay=None, dirty_rects=C.DIRTY_RECTS,
+                 startup=None):
+        # startup: StartupTimer do --startup-report (None = não mede)
+        self.startup = startup
+
+        # só os subsistemas usados (pg.init() iniciaria todos); o mixer
+        # é iniciado pelo SoundManager
+        pg.display.init()
+        pg.font.init()
+        self.mark("pygame init")
 
         # ---- JOYSTICK ----
         pg.joystick.init()
@@ -24,37 +37,239 @@ class Game:
         if pg.joystick.get_count() > 0:
             self.joy = pg.joystick.Joystick(0)
             self.joy.init()
+        self.mark("joystick")
 
         self.screen = pg.display.set_mode((C.WIDTH, C.HEIGHT))
         pg.display.set_caption("Asteroides")
+        self.mark("set_mode")
+
+        # só repinta o que mudou durante o jogo (None = flip completo sempre)
+        self.renderer = None
+        if dirty_rects:
+            from render import DirtyRenderer
+            self.renderer = DirtyRenderer(self.screen)
 
         self.clock = pg.time.Clock()
-        self.font = pg.font.SysFont("consolas", 20)
-        self.big = pg.font.SysFont("consolas", 48)
+        # baixa a qualidade visual se o frame passar do orçamento
+        self.governor = QualityGovernor() if C.QUALITY_GOVERNOR else None
+        self.font = load_font(20)
+        self.big = load_font(48)
+        self.mark("fontes")
 
         self.scene = Scene("menu")
-        self.world = World(self)
-        self.sound = SoundManager()
+
+        # gravação/reprodução de entradas (ver replay.py)
+        self.seed = seed
+        self.record_path = record
+        self.recorder = None
+        self.replay = None
+        if replay:
+            from replay import Replay
+            self.replay = Replay(replay)
+        self.replay_iter = None
+        if self.replay:
+            self.seed = self.replay.seed
+
+        # um só SoundManager para o processo, compartilhado com o World;
+        # sons, GIFs e fundo são decodificados em segundo plano enquanto o
+        # menu roda, e o World só é montado quando eles ficam prontos
+        self.sound = SoundManager(load=False)
+        self.mark("mixer")
+        self.loader = AssetLoader(game_assets(self.sound)).start()
+        self.world = None
+        self.snapshot = None   # módulo snapshot, importado junto com o World
+        self.rewind = None
+        self.mark("loader")
+
+        # entrada: teclas do frame + eventos de tiro/hiper ainda não simulados
+        self.keys = None
+        self.pending_fire = False
+        self.pending_hyper = False
 
         self.playing_intro = False
 
+        # simulação em passo fixo; o acumulador guarda o tempo ainda não simulado.
+        # Uma reprodução roda na taxa em que foi gravada (senão é outro jogo)
+        self.sim_dt = 1 / (self.replay.sim_hz if self.replay else C.SIM_HZ)
+        self.accumulator = 0.0
+
+        # profiler por etapa (F1); None = desligado, sem custo
+        self.profiler = None
+        self.profile_log = None
+        if C.PROFILER:
+            self.toggle_profiler()
+
+    def toggle_profiler(self):
+        if self.profiler:
+            self.profiler = None
+        else:
+            # reaproveita o histórico se já foi ligado antes
+            if self.profile_log is None:
+                from profiler import FrameProfiler
+                self.profile_log = FrameProfiler(keep=C.PROFILER_KEEP)
+            self.profiler = self.profile_log
+        if self.world:
+            self.world.profiler = self.profiler
+
+    def mark(self, phase):
+        if self.startup:
+            self.startup.mark(phase)
+
+    def report_startup(self):
+        """--startup-report: mede até o primeiro frame e o World pronto, e sai."""
+        self.mark("primeiro frame")
+        self.ensure_world()
+        self.mark("assets + World")
+        self.startup.report()
+        print(f"(thread de carregamento: {self.loader.elapsed * 1000:.1f} ms)")
+        self.quit()
+
+    def ensure_world(self):
+        """Monta o World; bloqueia se o carregamento ainda não terminou."""
+        if self.world is None:
+            self.loader.wait()
+            ASSETS.finalize()
+            from systems import World
+            import snapshot
+            self.world = World(self, seed=self.seed, sound=self.sound)
+            self.world.profiler = self.profiler
+            if self.governor:
+                self.world.quality = self.governor.settings
+            self.snapshot = snapshot
+            self.rewind = snapshot.RewindBuffer()
+        return self.world
+
+    def start_play(self, new_world=False):
+        self.ensure_world()
+        if new_world:
+            # reinicia no lugar: sons, sprites e pools continuam carregados
+            self.world.reset(self.seed)
+        self.rewind.clear()
+        self.scene = Scene("play")
+        self.accumulator = 0.0
+        self.pending_fire = self.pending_hyper = False
+        self.sound.play_track()
+
+        if self.replay:
+            self.replay_iter = iter(self.replay)
+        elif self.record_path and self.recorder is None:
+            # grava só a primeira partida
+            from replay import Recorder
+            self.recorder = Recorder(self.record_path, self.world.seed)
+
+    def stop_recording(self):
+        if self.recorder:
+            self.recorder.close()
+            print(f"Gravação salva em {self.record_path} ({self.recorder.steps} passos)")
+            self.record_path = None
+
+    def read_input(self):
+        """InputFrame do próximo passo (None quando a gravação acaba)."""
+        if self.replay_iter is not None:
+            return next(self.replay_iter, None)
+
+        inp = InputFrame.from_devices(self.keys, self.joy,
+                                      self.pending_fire, self.pending_hyper)
+        self.pending_fire = self.pending_hyper = False
+        return inp
+
+    def quit(self):
+        self.stop_recording()
+        if self.profile_log and self.profile_log.frames:
+            self.profile_log.export(C.PROFILER_EXPORT)
+            print(f"Profiler salvo em {C.PROFILER_EXPORT}")
+        pg.quit()
+        sys.exit()
+
+    def step_world(self, frame_dt):
+        """Avança o World em passos fixos e retorna o alpha de interpolação."""
+        self.accumulator += frame_dt
+        steps = 0
+        while self.accumulator >= self.sim_dt and steps < C.MAX_SIM_STEPS:
+            inp = self.read_input()
+            if inp is None:
+                print("Fim da gravação")
+                self.replay_iter = None
+                self.scene = Scene("gameover")
+                break
+            if self.recorder:
+                self.recorder.record(inp)
+
+            self.world.step(self.sim_dt, inp)
+            self.accumulator -= self.sim_dt
+            steps += 1
+
+            if self.scene.name != "play":
+                self.stop_recording()
+                break
+
+        # atrasou demais: descarta o resto em vez de tentar alcançar
+        if steps == C.MAX_SIM_STEPS:
+            self.accumulator = min(self.accumulator, self.sim_dt)
+
+        return self.accumulator / self.sim_dt
+
+    def apply_quality(self):
+        from sprites import AnimatedSprite
+
+        q = self.governor.settings
+        self.world.quality = q
+        AnimatedSprite.anim_scale = q.anim
+        if self.renderer:
+            self.renderer.invalidate()  # o fundo pode ter mudado
+
+    def can_rewind(self):
+        # voltar no tempo dessincronizaria a gravação/reprodução de entradas
+        return self.recorder is None and self.replay_iter is None
+
+    def quick_save(self):
+        self.snapshot.save(self.world, C.QUICKSAVE_FILE)
+        print(f"Snapshot salvo em {C.QUICKSAVE_FILE}")
+
+    def quick_load(self):
+        try:
+            self.snapshot.load(self.world, C.QUICKSAVE_FILE)
+        except (OSError, ValueError) as e:
+            print(f"Falha ao carregar {C.QUICKSAVE_FILE}: {e}")
+            return
+        self.rewind.clear()
+        self.accumulator = 0.0
+
+    def crash_dump(self):
+        """Salva o estado do World ao morrer com exceção (se der)."""
+        if self.world is None or self.snapshot is None:
+            return
+        try:
+            self.snapshot.save(self.world, C.CRASH_DUMP_FILE)
+            print(f"Estado salvo em {C.CRASH_DUMP_FILE}")
+        except Exception as e:
+            print(f"Falha ao salvar {C.CRASH_DUMP_FILE}: {e}")
+
     def run(self):
+        try:
+            self.loop()
+        except Exception:
+            self.crash_dump()
+            raise
+
+    def loop(self):
         while True:
             dt = self.clock.tick(C.FPS) / 1000
-
-            # valores do joystick (RT e D-pad)
-            rt_value = 0
-            dpad_up = False
-
-            if self.joy:
-                rt_value = (self.joy.get_axis(5) + 1) / 2  # 0 a 1
-                hat = self.joy.get_hat(0)
-                dpad_up = hat[1] == 1
+            # tempo de trabalho do frame anterior (sem a espera do tick)
+            if self.governor and self.scene.name == "play":
+                if self.governor.update(self.clock.get_rawtime()):
+                    self.apply_quality()
+            prof = self.profiler
+            if prof:
+                prof.begin()
 
             for e in pg.event.get():
                 if e.type == pg.QUIT:
-                    pg.quit()
-                    sys.exit()
+                    self.quit()
+
+                if e.type == pg.KEYDOWN and e.key == pg.K_F1:
+                    self.toggle_profiler()
+                    continue
 
                 # -------------------------
                 #        MENU
@@ -66,35 +281,43 @@ class Game:
 
                     # qualquer tecla inicia
                     if e.type == pg.KEYDOWN:
-                        self.scene = Scene("play")
                         self.playing_intro = False
-                        self.sound.play_track()
+                        self.start_play()
 
                     # botão Y sai do jogo
                     if e.type == pg.JOYBUTTONDOWN and e.button == 3:
-                        pg.quit()
-                        sys.exit()
+                        self.quit()
 
                 # -------------------------
                 #        PLAY
                 # -------------------------
                 elif self.scene.name == "play":
+                    # tiro/hiper entram no próximo passo de simulação
                     if e.type == pg.KEYDOWN and e.key == pg.K_SPACE:
-                        self.world.try_fire()
+                        self.pending_fire = True
 
                     if e.type == pg.JOYBUTTONDOWN and e.button == 0:  # A
-                        self.world.try_fire()
+                        self.pending_fire = True
 
                     if e.type == pg.KEYDOWN and e.key == pg.K_LSHIFT:
-                        self.world.hyperspace()
+                        self.pending_hyper = True
 
                     if e.type == pg.JOYBUTTONDOWN and e.button == 2:  # X = hiper
-                        self.world.hyperspace()
+                        self.pending_hyper = True
+
+                    # F3 mostra a grade de colisão
+                    if e.type == pg.KEYDOWN and e.key == pg.K_F3:
+                        self.world.debug_grid = not self.world.debug_grid
+
+                    # F5/F9: salvar/carregar snapshot rápido
+                    if e.type == pg.KEYDOWN and e.key == pg.K_F5:
+                        self.quick_save()
+                    if e.type == pg.KEYDOWN and e.key == pg.K_F9 and self.can_rewind():
+                        self.quick_load()
 
                     # botão Y sai do jogo
                     if e.type == pg.JOYBUTTONDOWN and e.button == 3:
-                        pg.quit()
-                        sys.exit()
+                        self.quit()
 
                 # -------------------------
                 #      GAME OVER
@@ -103,45 +326,85 @@ class Game:
 
                     # ENTER reinicia
                     if e.type == pg.KEYDOWN and e.key == pg.K_RETURN:
-                        self.world = World(self)
-                        self.scene = Scene("play")
-                        self.sound.play_track()
+                        self.start_play(new_world=True)
 
                     # ESC sai
                     if e.type == pg.KEYDOWN and e.key == pg.K_ESCAPE:
-                        pg.quit()
-                        sys.exit()
+                        self.quit()
 
                     # START reinicia
                     if e.type == pg.JOYBUTTONDOWN and e.button == 7:
-                        self.world = World(self)
-                        self.scene = Scene("play")
-                        self.sound.play_track()
+                        self.start_play(new_world=True)
 
                     # Y sai do jogo
                     if e.type == pg.JOYBUTTONDOWN and e.button == 3:
-                        pg.quit()
-                        sys.exit()
-
-            keys = pg.key.get_pressed()
-            self.screen.fill(C.BLACK)
-
-            # ---- ACELERAÇÃO POR RT OU DPAD ↑ ----
-            self.world.rt_accel = rt_value > 0.1
-            self.world.dpad_up = dpad_up
-
-            # Desenho da cena atual
-            if self.scene.name == "menu":
-                self.draw_menu()
-
-            elif self.scene.name == "play":
-                self.world.update(dt, keys)
-                self.world.draw(self.screen, self.font)
+                        self.quit()
+
+            # carregamento terminou durante o menu: monta o World já
+            if self.world is None and self.loader.ready():
+                self.ensure_world()
+
+            # teclas seguradas (RT/D-pad ↑ são lidos junto, em read_input)
+            self.keys = pg.key.get_pressed()
+            if prof:
+                prof.mark("events")
+
+            # Simulação (passos fixos) e desenho da cena atual
+            if self.scene.name == "play":
+                # BACKSPACE segurado volta no tempo, um frame por frame
+                # (partículas ficam de fora: são só visuais e encareceriam o delta)
+                rewind = C.REWIND and self.can_rewind()
+                if self.keys[pg.K_BACKSPACE] and rewind and len(self.rewind):
+                    self.snapshot.restore(self.world, self.rewind.pop(), particles=False)
+                    self.accumulator = 0.0
+                    alpha = 1.0
+                else:
+                    alpha = self.step_world(dt)
+                    if rewind:
+                        self.rewind.push(self.snapshot.capture(self.world, particles=False))
+                if prof:
+                    prof.mark("snapshot")
+            self.sound.tick()
+
+            dirty = None
+            if self.scene.name == "play" and self.renderer:
+                self.renderer.begin(self.world)
+                dirty = self.world.draw_entities(self.screen, self.font, alpha)
+            else:
+                self.screen.fill(C.BLACK)
+                if self.scene.name == "menu":
+                    self.draw_menu()
 
-            elif self.scene.name == "gameover":
-                self.draw_gameover()
+                elif self.scene.name == "play":
+                    self.world.draw(self.screen, self.font, alpha)
 
-            pg.display.flip()
+                elif self.scene.name == "gameover":
+                    self.draw_gameover()
+
+            if prof:
+                prof.mark("draw")
+                if self.world:
+                    prof.count(ufos=len(self.world.ufos), bullets=len(self.world.bullets),
+                               particles=len(self.world.particles),
+                               quality=self.world.quality.level)
+                notes = self.governor.recent() if self.governor else ()
+                area = prof.draw(self.screen, self.font, notes)
+                if dirty is not None:
+                    dirty.append(area)
+                prof.mark("overlay")
+
+            if dirty is not None:
+                self.renderer.present(dirty)
+            else:
+                pg.display.flip()
+                if self.renderer:
+                    # menu/game over desenharam a tela toda
+                    self.renderer.invalidate()
+            if self.startup:
+                self.report_startup()
+            if prof:
+                prof.mark("flip")
+                prof.end()
 
     # -------------------------
     #     MENU
@@ -158,6 +421,14 @@ class Game:
         text(self.screen, self.font,
              "Made by: Lethicia Lira e Guilherme Mota...", 260, 600)
 
+        # barra de progresso enquanto os assets carregam
+        if not self.loader.ready():
+            x, y, w, h = C.WIDTH // 2 - 150, 430, 300, 12
+            pg.draw.rect(self.screen, C.WHITE, (x, y, w, h), 1)
+            fill = int((w - 4) * self.loader.progress)
+            pg.draw.rect(self.screen, C.WHITE, (x + 2, y + 2, fill, h - 4))
+            text(self.screen, self.font, "Carregando...", x, y + 18)
+
     # -------------------------
     #     GAME OVER
     # -------------------------
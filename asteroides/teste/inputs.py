@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+
+import pygame as pg
+
+RT_DEADZONE = 0.1  # gatilho RT acima disso acelera
+
+# bits do campo "buttons" na gravação
+LEFT, RIGHT, UP, FIRE, HYPER = 1, 2, 4, 8, 16
+
+
+@dataclass(frozen=True)
+class InputFrame:
+    """Entrada de um passo de simulação.
+
+    Indexável como ``pg.key.get_pressed()`` (o que ``Ship.control`` usa),
+    mas também carrega RT/D-pad e os eventos de tiro/hiperespaço, para o
+    World poder ser reproduzido passo a passo a partir de uma gravação.
+    ``rt`` já vem quantizado em 0..255.
+    """
+
+    left: bool = False
+    right: bool = False
+    up: bool = False
+    fire: bool = False
+    hyper: bool = False
+    rt: int = 0
+    hat_y: int = 0
+
+    def __getitem__(self, key):
+        if key in (pg.K_LEFT, pg.K_a):
+            return self.left
+        if key in (pg.K_RIGHT, pg.K_d):
+            return self.right
+        if key in (pg.K_UP, pg.K_w):
+            # RT e D-pad ↑ também aceleram
+            return self.up or self.rt > RT_DEADZONE * 255 or self.hat_y == 1
+        return False
+
+    def pack(self):
+        buttons = (LEFT * self.left | RIGHT * self.right | UP * self.up
+                   | FIRE * self.fire | HYPER * self.hyper)
+        return buttons, self.rt, self.hat_y
+
+    @classmethod
+    def unpack(cls, buttons, rt, hat_y):
+        return cls(bool(buttons & LEFT), bool(buttons & RIGHT), bool(buttons & UP),
+                   bool(buttons & FIRE), bool(buttons & HYPER), rt, hat_y)
+
+    @classmethod
+    def from_devices(cls, keys, joy=None, fire=False, hyper=False):
+        rt, hat_y = 0, 0
+        if joy:
+            rt = round((joy.get_axis(5) + 1) / 2 * 255)  # 0 a 255
+            hat_y = joy.get_hat(0)[1]
+        return cls(
+            left=bool(keys[pg.K_LEFT] or keys[pg.K_a]),
+            right=bool(keys[pg.K_RIGHT] or keys[pg.K_d]),
+            up=bool(keys[pg.K_UP] or keys[pg.K_w]),
+            fire=fire,
+            hyper=hyper,
+            rt=max(0, min(255, rt)),
+            hat_y=hat_y,
+        )
+
+
+NO_INPUT = InputFrame()
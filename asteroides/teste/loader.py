@@ -0,0 +1,68 @@
+import importlib
+import threading
+import time
+from functools import partial
+
+import config as C
+from assets import ASSETS
+
+
+class AssetLoader:
+    """Roda tarefas de carregamento numa thread enquanto o menu aparece.
+
+    As tarefas só decodificam (sons, GIFs, imagens); o que precisa da
+    thread principal (convert_alpha) fica para ``ASSETS.finalize()``,
+    chamado depois de ``wait()``.
+    """
+
+    def __init__(self, tasks):
+        self.tasks = list(tasks)  # (nome, função sem argumentos)
+        self.total = len(self.tasks)
+        self.done = 0
+        self.current = None
+        self.elapsed = 0.0  # duração total das tarefas, em s
+        self.finished = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="asset-loader", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def run(self):
+        start = time.perf_counter()
+        for name, task in self.tasks:
+            self.current = name
+            try:
+                task()
+            except Exception as e:
+                # o carregamento síncrono tenta de novo (e tem os fallbacks)
+                print(f"Falha ao carregar {name}: {e}")
+            self.done += 1
+        self.current = None
+        self.elapsed = time.perf_counter() - start
+        self.finished.set()
+
+    @property
+    def progress(self):
+        return self.done / max(1, self.total)
+
+    def ready(self):
+        return self.finished.is_set()
+
+    def wait(self, timeout=None):
+        return self.finished.wait(timeout)
+
+
+def game_assets(sound):
+    """Tarefas de carregamento do jogo completo."""
+    from sprites import SHIP_GIF, UFO_GIF, SPRITE_SCALE, SHIP_BASE_ANGLE, BACKGROUND
+
+    return [
+        # módulos da simulação (numpy etc.) só são usados quando o jogo começa
+        ("módulos", partial(importlib.import_module, "systems")),
+        ("sons", sound.load_sounds),
+        ("nave", partial(ASSETS.decode_atlas, SHIP_GIF, SPRITE_SCALE,
+                         C.SHIP_ROT_STEP, SHIP_BASE_ANGLE)),
+        ("ufo", partial(ASSETS.decode_frames, UFO_GIF, SPRITE_SCALE)),
+        ("fundo", partial(ASSETS.decode_image, BACKGROUND, (C.WIDTH, C.HEIGHT))),
+    ]
@@ -1,9 +1,91 @@
+import time
 
-from game import Game
- 
+T0 = time.perf_counter()  # início do processo, para o --startup-report
 
-def main():
-    Game().run()
+import argparse  # noqa: E402
+
+
+def seed_arg(text):
+    # a seed vai para o cabeçalho das gravações/snapshots como int64
+    seed = int(text)
+    if not -2 ** 63 <= seed < 2 ** 63:
+        raise argparse.ArgumentTypeError("a seed precisa caber em 64 bits com sinal")
+    return seed
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Asteroides")
+    parser.add_argument("--headless", action="store_true",
+                        help="roda a simulação sem janela, sem áudio e sem render")
+    parser.add_argument("--steps", type=int, default=None,
+                        help="passos de simulação por jogo no modo headless")
+    parser.add_argument("--games", type=int, default=1,
+                        help="quantidade de jogos no modo headless")
+    parser.add_argument("--seed", type=seed_arg, default=None,
+                        help="seed do RNG do World (padrão: config.RANDOM_SEED)")
+    parser.add_argument("--record", metavar="ARQ",
+                        help="grava as entradas da primeira partida em ARQ")
+    parser.add_argument("--replay", metavar="ARQ",
+                        help="reproduz uma gravação (com --headless: sem limite de FPS)")
+    parser.add_argument("--bake-assets", action="store_true",
+                        help="regera as spritesheets do cache e sai")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="mede cada fase da inicialização até o menu e sai")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="atualiza só as regiões da tela que mudaram")
+    return parser.parse_args(argv)
+
+
+def report(label, world, done, secs):
+    print(f"{label}: {done} passos em {secs:.2f}s "
+          f"({done / max(secs, 1e-9):.0f} passos/s)  "
+          f"score {world.score}  wave {world.wave}  vidas {world.lives}")
+
+
+def run_headless(args):
+    import config as C
+
+    if args.replay:
+        from replay import replay_headless
+        report("replay", *replay_headless(args.replay))
+        return
+
+    from sim import run_headless
+
+    steps = args.steps or C.SIM_HZ * 60
+    for i in range(args.games):
+        report(f"jogo {i + 1}", *run_headless(steps, seed=args.seed))
+
+
+def bake_assets():
+    from assets import bake_sheet, sheet_paths
+    from sprites import ANIMATED
+
+    for path, scale in ANIMATED:
+        frames = bake_sheet(path, scale)
+        print(f"{sheet_paths(path, scale)[0]}: {len(frames)} frames")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.bake_assets:
+        bake_assets()
+        return
+    if args.headless:
+        run_headless(args)
+        return
+
+    startup = None
+    if args.startup_report:
+        from profiler import StartupTimer
+        startup = StartupTimer(T0)
+
+    from game import Game
+    import config as C
+    if startup:
+        startup.mark("imports")
+    Game(seed=args.seed, record=args.record, replay=args.replay,
+         dirty_rects=args.dirty_rects or C.DIRTY_RECTS, startup=startup).run()
 
 
 if __name__ == "__main__":
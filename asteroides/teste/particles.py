@@ -0,0 +1,90 @@
+import math
+
+import numpy as np
+
+import config as C
+from assets import ASSETS
+from pool import Pool
+
+MAX_COLORS = 8
+MAX_SIZE = 8
+
+
+class ParticleSystem(Pool):
+    """Partículas em arrays NumPy pré-alocados.
+
+    Nada de um Sprite por partícula: update, remoção das mortas e desenho
+    são feitos em lote. Passando de ``capacity``, novas partículas são
+    simplesmente descartadas.
+    """
+
+    fields = ("pos", "vel", "ttl", "life", "size", "color")
+
+    def __init__(self, capacity=C.MAX_PARTICLES, rng=None):
+        super().__init__(capacity)
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.ttl = np.zeros(capacity, np.float32)    # tempo restante
+        self.life = np.ones(capacity, np.float32)    # tempo total
+        self.size = np.zeros(capacity, np.intp)
+        self.color = np.zeros(capacity, np.intp)     # índice na paleta
+
+        # tabela [cor, tamanho, nível de alpha] -> Surface compartilhada
+        self.palette = []
+        self.table = np.empty((MAX_COLORS, MAX_SIZE + 1, C.ALPHA_LEVELS), object)
+
+    def color_index(self, color):
+        color = tuple(color)
+        if color in self.palette:
+            return self.palette.index(color)
+        if len(self.palette) >= MAX_COLORS:
+            raise ValueError(f"paleta de partículas cheia ({MAX_COLORS} cores)")
+
+        idx = len(self.palette)
+        self.palette.append(color)
+        for size in range(1, MAX_SIZE + 1):
+            for level in range(C.ALPHA_LEVELS):
+                self.table[idx, size, level] = ASSETS.get_shape("circle", color, size, level)
+        return idx
+
+    def emit(self, pos, amount, speed=(50, 200), size=(2, 4), ttl=(0.4, 0.9),
+             color=(255, 255, 255)):
+        """Explosão radial em ``pos``. Retorna quantas partículas couberam."""
+        color = self.color_index(color)
+        sl = self.alloc(amount)
+        n = sl.stop - sl.start
+        if n == 0:
+            return 0
+
+        rng = self.rng
+        angle = rng.uniform(0, math.tau, n)
+        spd = rng.uniform(speed[0], speed[1], n)
+
+        self.pos[sl] = (pos[0], pos[1])
+        self.vel[sl, 0] = np.cos(angle) * spd
+        self.vel[sl, 1] = np.sin(angle) * spd
+        self.life[sl] = rng.uniform(ttl[0], ttl[1], n)
+        self.ttl[sl] = self.life[sl]
+        self.size[sl] = np.clip(np.rint(rng.uniform(size[0], size[1], n)), 1, MAX_SIZE)
+        self.color[sl] = color
+        return n
+
+    def update(self, dt):
+        if self.count == 0:
+            return
+        # partículas não dão a volta na tela
+        self.move(dt, wrap=False)
+        n = self.count
+        self.ttl[:n] -= dt
+        self.remove(self.ttl[:n] <= 0)
+
+    def blits(self, lag):
+        n = self.count
+        size = self.size[:n]
+        level = (self.ttl[:n] / self.life[:n] * C.ALPHA_LEVELS).astype(np.intp)
+        np.clip(level, 0, C.ALPHA_LEVELS - 1, out=level)
+
+        images = self.table[self.color[:n], size, level]
+        return images, self.pos[:n] - self.vel[:n] * lag - size[:, None]
@@ -0,0 +1,76 @@
+import numpy as np
+
+import config as C
+
+
+class Pool:
+    """Base dos pools struct-of-arrays (tiros, partículas, asteroides).
+
+    Cada objeto é uma linha em arrays de capacidade fixa; as ``count``
+    primeiras linhas são as vivas. As subclasses criam os arrays e listam
+    os nomes deles em ``fields`` (todos são compactados juntos).
+    """
+
+    fields = ()
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.count = 0
+        self.bounds = np.array([C.WIDTH, C.HEIGHT], np.float32)
+
+    def __len__(self):
+        return self.count
+
+    def alloc(self, n):
+        """Reserva até ``n`` linhas no fim; retorna o slice (vazio se cheio)."""
+        n = max(0, min(n, self.capacity - self.count))
+        sl = slice(self.count, self.count + n)
+        self.count += n
+        return sl
+
+    def move(self, dt, wrap=True):
+        n = self.count
+        pos = self.pos[:n]
+        pos += self.vel[:n] * dt
+        if wrap:
+            np.mod(pos, self.bounds, out=pos)
+
+    def kill(self, indices):
+        """Remove as linhas dadas (índices válidos até a próxima remoção)."""
+        if len(indices) == 0:
+            return
+        dead = np.zeros(self.count, bool)
+        dead[np.asarray(indices, np.intp)] = True
+        self.remove(dead)
+
+    def remove(self, dead):
+        """Compacta as vivas para o início dos arrays (``dead``: máscara)."""
+        if not dead.any():
+            return
+        n = self.count
+        alive = ~dead
+        k = int(np.count_nonzero(alive))
+        for name in self.fields:
+            arr = getattr(self, name)
+            arr[:k] = arr[:n][alive]
+        self.count = k
+
+    def clear(self):
+        self.count = 0
+
+    def blits(self, lag):
+        """(imagens, cantos superiores esquerdos) das linhas vivas."""
+        raise NotImplementedError
+
+    def draw(self, surf, lag=0.0, rects=None):
+        """``lag``: segundos a recuar a partir do estado atual (interpolação).
+
+        Se ``rects`` for uma lista, recebe os retângulos desenhados.
+        """
+        if self.count == 0:
+            return
+        images, topleft = self.blits(lag)
+        drawn = surf.blits(zip(images, topleft.astype(np.int32).tolist()),
+                           doreturn=rects is not None)
+        if rects is not None:
+            rects.extend(drawn)
@@ -0,0 +1,180 @@
+import csv
+import json
+import time
+from collections import defaultdict, deque
+
+import pygame as pg
+
+import config as C
+
+# cores das etapas no gráfico (cicla se houver mais etapas)
+STAGE_COLORS = [
+    (80, 160, 255), (255, 200, 60), (120, 220, 120), (255, 110, 110),
+    (200, 120, 255), (60, 220, 220), (255, 150, 60), (180, 180, 180),
+]
+
+
+class FrameProfiler:
+    """Tempo por etapa do frame.
+
+    ``mark(nome)`` atribui a ``nome`` o tempo desde a marca anterior (ou
+    desde ``begin()``), então basta marcar o fim de cada etapa. Marcas
+    repetidas no mesmo frame (vários passos de simulação) se somam.
+    ``keep`` limita quantos frames ficam guardados para exportar.
+    """
+
+    def __init__(self, keep=None, history=C.PROFILER_HISTORY):
+        self.clock = time.perf_counter
+        self.t = self.clock()
+        self.start = self.t
+        self.current = defaultdict(float)
+        self.counts = {}
+        self.frames = deque(maxlen=keep)     # (total, {etapa: s}, {entidade: n})
+        self.history = deque(maxlen=history)  # janela do gráfico na tela
+
+    def begin(self):
+        self.start = self.t = self.clock()
+        self.current = defaultdict(float)
+        self.counts = {}
+
+    def mark(self, name):
+        now = self.clock()
+        self.current[name] += now - self.t
+        self.t = now
+
+    def count(self, **counts):
+        """Registra contagens de entidades do frame atual."""
+        self.counts.update(counts)
+
+    def end(self):
+        total = self.clock() - self.start
+        record = (total, dict(self.current), dict(self.counts))
+        self.frames.append(record)
+        self.history.append(record)
+        return total
+
+    def stage_names(self):
+        names = []
+        for _, stages, _ in self.frames:
+            for name in stages:
+                if name not in names:
+                    names.append(name)
+        return names
+
+    def summary(self):
+        """Média por frame de cada etapa, em ms."""
+        n = max(1, len(self.frames))
+        totals = defaultdict(float)
+        for _, stages, _ in self.frames:
+            for name, secs in stages.items():
+                totals[name] += secs
+        return {name: totals[name] * 1000 / n for name in self.stage_names()}
+
+    # ------------------------------------------------------------------
+    # Exportação
+    # ------------------------------------------------------------------
+    def export(self, path):
+        """Salva os frames guardados em CSV ou JSON (pela extensão)."""
+        stages = self.stage_names()
+        counts = []
+        for _, _, c in self.frames:
+            for name in c:
+                if name not in counts:
+                    counts.append(name)
+
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({
+                    "summary_ms": self.summary(),
+                    "frames": [
+                        {"total_ms": total * 1000,
+                         "stages_ms": {k: v * 1000 for k, v in st.items()},
+                         "counts": c}
+                        for total, st, c in self.frames
+                    ],
+                }, f)
+            return
+
+        with open(path, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["frame", "total_ms"] + [f"{s}_ms" for s in stages] + counts)
+            for i, (total, st, c) in enumerate(self.frames):
+                w.writerow([i, f"{total * 1000:.4f}"]
+                           + [f"{st.get(s, 0.0) * 1000:.4f}" for s in stages]
+                           + [c.get(n, "") for n in counts])
+
+    # ------------------------------------------------------------------
+    # Overlay na tela
+    # ------------------------------------------------------------------
+    def draw(self, surf, font, notes=(), width=C.PROFILER_HISTORY * 2, height=120):
+        """Gráfico empilhado dos últimos frames + médias e contagens.
+
+        ``notes``: linhas extras no fim da legenda (ex.: decisões do
+        QualityGovernor). Retorna o retângulo ocupado na tela.
+        """
+        if not self.history:
+            return pg.Rect(0, 0, 0, 0)
+
+        x0 = surf.get_width() - width - 10
+        y0 = surf.get_height() - height - 10
+        panel = pg.Surface((width, height), pg.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        surf.blit(panel, (x0, y0))
+
+        stages = self.stage_names()
+        colors = {s: STAGE_COLORS[i % len(STAGE_COLORS)] for i, s in enumerate(stages)}
+        budget_ms = 1000 / C.FPS
+        scale = height / (budget_ms * 2)  # topo do gráfico = 2x o orçamento
+        bar_w = max(1, width // self.history.maxlen)
+
+        for i, (_, st, _) in enumerate(self.history):
+            y = y0 + height
+            for name, secs in st.items():
+                h = secs * 1000 * scale
+                if h < 1:
+                    continue
+                y -= h
+                pg.draw.rect(surf, colors[name], (x0 + i * bar_w, int(y), bar_w, int(h) + 1))
+
+        # linha do orçamento de 16.6 ms
+        by = y0 + height - int(budget_ms * scale)
+        pg.draw.line(surf, C.WHITE, (x0, by), (x0 + width, by))
+
+        # legenda com média recente por etapa
+        recent = len(self.history)
+        lines = []
+        for name in stages:
+            ms = sum(st.get(name, 0.0) for _, st, _ in self.history) * 1000 / recent
+            lines.append((f"{name} {ms:.2f}ms", colors[name]))
+        total = sum(t for t, _, _ in self.history) * 1000 / recent
+        lines.append((f"total {total:.2f}ms", C.WHITE))
+        counts = self.history[-1][2]
+        if counts:
+            lines.append(("  ".join(f"{k} {v}" for k, v in counts.items()), C.WHITE))
+        lines.extend((note, C.WHITE) for note in notes)
+
+        y = y0 - len(lines) * (font.get_linesize() + 1)
+        area = pg.Rect(x0, y0, width, height)
+        for s, color in lines:
+            area.union_ip(surf.blit(font.render(s, True, color), (x0, y)))
+            y += font.get_linesize() + 1
+        return area
+
+
+class StartupTimer:
+    """Duração de cada fase da inicialização (``main.py --startup-report``)."""
+
+    def __init__(self, start=None):
+        self.clock = time.perf_counter
+        self.start = self.t = start if start is not None else self.clock()
+        self.phases = []
+
+    def mark(self, name):
+        now = self.clock()
+        self.phases.append((name, now - self.t))
+        self.t = now
+
+    def report(self):
+        for name, secs in self.phases:
+            print(f"{name:18s} {secs * 1000:8.1f} ms")
+        print(f"{'total':18s} {(self.t - self.start) * 1000:8.1f} ms")
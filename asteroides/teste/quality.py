@@ -0,0 +1,74 @@
+from collections import deque, namedtuple
+
+import config as C
+
+# o que cada nível de qualidade mantém; nada aqui muda a jogabilidade
+Quality = namedtuple("Quality", "level particles anim effects background")
+
+LEVELS = [
+    Quality(0, particles=1.0, anim=1.0, effects=True, background=True),
+    Quality(1, particles=0.5, anim=1.0, effects=True, background=True),
+    Quality(2, particles=0.25, anim=0.5, effects=False, background=True),
+    Quality(3, particles=0.1, anim=0.25, effects=False, background=False),
+]
+FULL = LEVELS[0]
+
+
+class QualityGovernor:
+    """Baixa a qualidade visual quando o frame estoura o orçamento.
+
+    Acompanha a média móvel exponencial do tempo de trabalho por frame.
+    Acima de ``high`` x orçamento por ``down_frames`` frames seguidos,
+    desce um nível; abaixo de ``low`` x orçamento por ``up_frames``,
+    sobe um. A faixa entre os dois limiares e a espera maior para subir
+    evitam oscilar.
+    """
+
+    def __init__(self, budget_ms=1000 / C.FPS, smoothing=C.QUALITY_EMA,
+                 high=C.QUALITY_HIGH, low=C.QUALITY_LOW,
+                 down_frames=C.QUALITY_DOWN_FRAMES, up_frames=C.QUALITY_UP_FRAMES):
+        self.budget = budget_ms
+        self.smoothing = smoothing
+        self.high = high * budget_ms
+        self.low = low * budget_ms
+        self.down_frames = down_frames
+        self.up_frames = up_frames
+
+        self.level = 0
+        self.ema = None
+        self.over = 0    # frames seguidos acima de high
+        self.under = 0   # frames seguidos abaixo de low
+        self.decisions = deque(maxlen=32)  # (frame, nível, ema)
+        self.frame = 0
+
+    @property
+    def settings(self):
+        return LEVELS[self.level]
+
+    def update(self, frame_ms):
+        """Registra o tempo do frame; retorna True se o nível mudou."""
+        self.frame += 1
+        if self.ema is None:
+            self.ema = frame_ms
+        else:
+            self.ema += self.smoothing * (frame_ms - self.ema)
+
+        self.over = self.over + 1 if self.ema > self.high else 0
+        self.under = self.under + 1 if self.ema < self.low else 0
+
+        if self.over >= self.down_frames and self.level < len(LEVELS) - 1:
+            return self.set_level(self.level + 1)
+        if self.under >= self.up_frames and self.level > 0:
+            return self.set_level(self.level - 1)
+        return False
+
+    def set_level(self, level):
+        self.level = level
+        self.over = self.under = 0
+        self.decisions.append((self.frame, level, self.ema))
+        return True
+
+    def recent(self, n=3):
+        """Últimas ``n`` mudanças de nível, da mais nova para a mais velha."""
+        return [f"qualidade {level}: média {ema:.1f}ms, há {self.frame - frame}f"
+                for frame, level, ema in list(self.decisions)[::-1][:n]]
@@ -0,0 +1,58 @@
+import pygame as pg
+
+import config as C
+
+
+class DirtyRenderer:
+    """Atualiza só as regiões da tela que mudaram.
+
+    A cada frame apaga (restaurando o fundo) os retângulos desenhados no
+    frame anterior, o World desenha por cima e ``present`` envia à tela a
+    união dos retângulos antigos e novos. Quando a área suja passa de
+    ``max_area`` da tela, ou há retângulos demais, volta ao flip completo.
+    """
+
+    def __init__(self, screen, max_area=C.DIRTY_MAX_AREA, max_rects=C.DIRTY_MAX_RECTS):
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.max_area = max_area * self.screen_rect.width * self.screen_rect.height
+        self.max_rects = max_rects
+        self.prev = []
+        self.full = True      # conteúdo da tela desconhecido: redesenha tudo
+        self.flips = 0
+        self.partial = 0
+
+    def invalidate(self):
+        """Força um redesenho completo no próximo frame (troca de cena etc.)."""
+        self.full = True
+
+    def too_big(self, rects):
+        if len(rects) > self.max_rects:
+            return True
+        area = 0
+        for r in rects:
+            area += r.width * r.height
+        return area > self.max_area
+
+    def begin(self, world):
+        """Apaga o frame anterior: fundo inteiro ou só os retângulos sujos."""
+        if self.full or self.too_big(self.prev):
+            world.draw_background(self.screen)
+            self.full = True
+        else:
+            for r in self.prev:
+                world.draw_background(self.screen, r)
+
+    def present(self, rects):
+        """Envia o frame à tela; ``rects`` = o que foi desenhado neste frame."""
+        clip = self.screen_rect
+        rects = [r.clip(clip) for r in rects]
+        dirty = self.prev + rects
+        if self.full or self.too_big(dirty):
+            pg.display.flip()
+            self.flips += 1
+        else:
+            pg.display.update(dirty)
+            self.partial += 1
+        self.prev = rects
+        self.full = False
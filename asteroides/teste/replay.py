@@ -0,0 +1,89 @@
+"""Gravação e reprodução determinística de partidas.
+
+Formato: cabeçalho fixo + fluxo zlib com 3 bytes por passo de simulação
+(botões, RT, hat do D-pad). Com a mesma seed e o mesmo passo fixo, o
+World refaz exatamente a mesma partida.
+"""
+import struct
+import time
+import zlib
+
+import config as C
+from inputs import InputFrame
+
+MAGIC = b"ARPL"
+VERSION = 1
+HEADER = struct.Struct("<4sHqd")   # magic, versão, seed (com sinal), passos/s
+STEP = struct.Struct("<BBb")       # botões, rt, hat_y
+
+
+class Recorder:
+    def __init__(self, path, seed, sim_hz=C.SIM_HZ):
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, sim_hz))
+        self.zip = zlib.compressobj(9)
+        self.buf = bytearray()
+        self.steps = 0
+
+    def record(self, inp):
+        self.buf += STEP.pack(*inp.pack())
+        self.steps += 1
+        if len(self.buf) >= 4096:
+            self.file.write(self.zip.compress(bytes(self.buf)))
+            self.buf.clear()
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.file.write(self.zip.compress(bytes(self.buf)))
+        self.file.write(self.zip.flush())
+        self.file.close()
+
+
+class Replay:
+    """Gravação carregada; itere para obter um InputFrame por passo."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, self.seed, self.sim_hz = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: não é uma gravação v{VERSION}")
+
+        raw = zlib.decompress(data[HEADER.size:])
+        cache = {}
+        self.frames = []
+        for packed in STEP.iter_unpack(raw):
+            inp = cache.get(packed)
+            if inp is None:
+                inp = cache[packed] = InputFrame.unpack(*packed)
+            self.frames.append(inp)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __iter__(self):
+        return iter(self.frames)
+
+
+def replay_headless(path):
+    """Reproduz uma gravação sem display nem limite de FPS.
+
+    Retorna ``(world, passos, segundos)``.
+    """
+    from sim import HeadlessGame
+    from systems import World
+
+    rep = Replay(path)
+    game = HeadlessGame()
+    world = World(game, headless=True, seed=rep.seed)
+    dt = 1 / rep.sim_hz
+
+    start = time.perf_counter()
+    steps = 0
+    for inp in rep:
+        if game.scene.name != "play":
+            break
+        world.step(dt, inp)
+        steps += 1
+    return world, steps, time.perf_counter() - start
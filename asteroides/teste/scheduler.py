@@ -0,0 +1,78 @@
+import time
+
+# folga na comparação com o período: somar 1/SIM_HZ várias vezes em float
+# fica um pouco abaixo do valor exato
+EPSILON = 1e-9
+
+
+class Scheduler:
+    """Subsistemas do World, cada um com sua própria taxa.
+
+    ``add(nome, fn, hz)`` registra ``fn(dt)``; sem ``hz`` ela roda em todo
+    passo de simulação. Com ``hz``, ``fn`` roda quando o tempo acumulado
+    passa de ``1 / hz`` e recebe o dt desde a chamada anterior; a sobra
+    fica para o próximo ciclo, então a taxa média é a configurada.
+
+    Chamadas e tempo gasto por subsistema são sempre contados (ver
+    ``report``); com profiler, cada subsistema vira também uma etapa com
+    o próprio nome.
+    """
+
+    def __init__(self):
+        self.clock = time.perf_counter
+        self.names = []
+        self.funcs = []
+        self.periods = []
+        # acumulador de fase e dt desde a última chamada: fazem parte do
+        # estado da simulação (entram no snapshot)
+        self.acc = []
+        self.since = []
+        self.calls = []
+        self.time = []
+
+    def add(self, name, fn, hz=None):
+        self.names.append(name)
+        self.funcs.append(fn)
+        self.periods.append(1 / hz if hz else 0.0)
+        self.acc.append(0.0)
+        self.since.append(0.0)
+        self.calls.append(0)
+        self.time.append(0.0)
+
+    def reset(self):
+        n = len(self.funcs)
+        self.acc = [0.0] * n
+        self.since = [0.0] * n
+        self.calls = [0] * n
+        self.time = [0.0] * n
+
+    def run(self, dt, prof=None):
+        clock = self.clock
+        acc, since = self.acc, self.since
+        for i, fn in enumerate(self.funcs):
+            acc[i] += dt
+            since[i] += dt
+            period = self.periods[i]
+            if acc[i] + EPSILON >= period:
+                # passo maior que o período: roda uma vez e descarta o atraso
+                acc[i] = acc[i] - period if acc[i] < 2 * period else 0.0
+                t = clock()
+                fn(since[i])
+                self.time[i] += clock() - t
+                self.calls[i] += 1
+                since[i] = 0.0
+            if prof:
+                prof.mark(self.names[i])
+
+    def report(self, seconds):
+        """Por subsistema, em ``seconds`` de simulação: taxa configurada
+        (None = todo passo), chamadas por segundo e ms gastos por segundo."""
+        seconds = max(seconds, 1e-9)
+        return {
+            name: {
+                "hz": 1 / period if period else None,
+                "calls_per_s": calls / seconds,
+                "ms_per_s": spent * 1000 / seconds,
+            }
+            for name, period, calls, spent in zip(self.names, self.periods, self.calls, self.time)
+        }
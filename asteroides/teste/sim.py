@@ -0,0 +1,103 @@
+import math
+import random
+import time
+
+import config as C
+from game import Scene
+from inputs import NO_INPUT, InputFrame
+from sound import NullSound
+from systems import World
+from utils import Vec
+
+
+class HeadlessGame:
+    """O mínimo de Game que o World usa (cena e som), sem display."""
+
+    def __init__(self):
+        self.scene = Scene("play")
+        self.sound = NullSound()
+
+
+def idle_policy(world):
+    return NO_INPUT
+
+
+class RandomPilot:
+    """Aperta botões ao acaso (mantém cada escolha por alguns passos)."""
+
+    def __init__(self, seed=None, hold=12):
+        self.rng = random.Random(seed)
+        self.hold = hold
+        self.left = self.right = self.up = False
+        self.timer = 0
+
+    def __call__(self, world):
+        self.timer -= 1
+        if self.timer <= 0:
+            self.timer = self.hold
+            self.left = self.rng.random() < 0.3
+            self.right = not self.left and self.rng.random() < 0.4
+            self.up = self.rng.random() < 0.4
+        return InputFrame(self.left, self.right, self.up,
+                          fire=self.rng.random() < 0.1,
+                          hyper=self.rng.random() < 0.001)
+
+
+class ScriptedPilot:
+    """Mira no alvo mais próximo (UFO ou asteroide) e atira quando alinhado."""
+
+    def __init__(self, seed=None, tolerance=8.0):
+        self.tolerance = tolerance
+        self.fire_cool = 0.0
+
+    def __call__(self, world):
+        ship = world.ship
+        self.fire_cool -= world.step_dt or 1 / C.SIM_HZ
+
+        targets = [(ship.pos.distance_squared_to(u.pos), u.pos) for u in world.ufos]
+        rocks = world.asteroids
+        if rocks.count:
+            dist = ((rocks.pos[:rocks.count] - (ship.pos.x, ship.pos.y)) ** 2).sum(axis=1)
+            i = int(dist.argmin())
+            targets.append((float(dist[i]), Vec(*rocks.pos[i].tolist())))
+        if not targets:
+            return NO_INPUT
+
+        _, target = min(targets, key=lambda t: t[0])
+        d = target - ship.pos
+        # mesma convenção da nave: ângulo 0 = direita, positivo = anti-horário
+        want = math.degrees(math.atan2(-d.y, d.x))
+        diff = (want - ship.angle + 180) % 360 - 180
+
+        fire = abs(diff) < self.tolerance and self.fire_cool <= 0
+        if fire:
+            self.fire_cool = C.SHIP_FIRE_RATE
+        return InputFrame(left=diff > self.tolerance / 2,
+                          right=diff < -self.tolerance / 2,
+                          up=d.length_squared() > 250 ** 2,
+                          fire=fire)
+
+
+PILOTS = {
+    "idle": lambda seed=None: idle_policy,
+    "random": RandomPilot,
+    "scripted": ScriptedPilot,
+}
+
+
+def run_headless(steps=C.SIM_HZ * 60, policy=idle_policy, dt=None, seed=None):
+    """Roda um jogo sem display/áudio o mais rápido possível.
+
+    ``policy(world)`` devolve o InputFrame do passo. Para no game over.
+    Retorna ``(world, passos_executados, segundos)``.
+    """
+    dt = dt or 1 / C.SIM_HZ
+    game = HeadlessGame()
+    world = World(game, headless=True, seed=seed)
+
+    start = time.perf_counter()
+    step = 0
+    while step < steps and game.scene.name == "play":
+        world.step(dt, policy(world))
+        step += 1
+    return world, step, time.perf_counter() - start
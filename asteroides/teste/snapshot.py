@@ -0,0 +1,340 @@
+"""Snapshots binários do World e buffer de rewind.
+
+Formato: cabeçalho fixo (escalares, nave, contagens, estados dos RNGs,
+acumuladores do Scheduler) +
+os arrays dos pools (UFOs, tiros, partículas, asteroides) em sequência,
+só as linhas vivas. Nada de pickle: objetos pygame viram números.
+"""
+import math
+import struct
+import zlib
+from collections import deque
+
+import numpy as np
+
+import config as C
+from sprites import UFO
+from utils import Vec
+
+MAGIC = b"ASNP"
+VERSION = 3
+
+HEADER = struct.Struct(
+    "<4sH"         # magic, versão
+    "qiiq"         # score, vidas, wave, seed (com sinal)
+    "9d"           # timers e dificuldade (WORLD_FLOATS)
+    "9di"          # nave: pos, prev_pos, vel, ângulo, invuln, timer, frame
+    "6I"           # UFOs, tiros, partículas, asteroides, cores da paleta, subsistemas
+)
+WORLD_FLOATS = ("wave_timer", "time_between_waves", "ufo_spawn_rate", "ufo_speed_mult",
+                "wave_cool", "safe", "ufo_timer", "hyperspace_cd", "step_dt")
+
+# random.Random: 625 uint32 + gauss guardado (nan = nenhum)
+PY_RNG = struct.Struct("<625Id")
+# numpy PCG64: state e inc (128 bits cada), has_uint32, uinteger
+NP_RNG = struct.Struct("<16s16sBI")
+
+# um UFO por linha: pos, prev_pos, dir, speed, shoot_cool, timer, frame, small
+UFO_FIELDS = 11
+
+
+def pack_py_rng(rng):
+    _, state, gauss = rng.getstate()
+    return PY_RNG.pack(*state, math.nan if gauss is None else gauss)
+
+
+def unpack_py_rng(rng, data, offset):
+    *state, gauss = PY_RNG.unpack_from(data, offset)
+    rng.setstate((3, tuple(state), None if math.isnan(gauss) else gauss))
+    return offset + PY_RNG.size
+
+
+def pack_np_rng(gen):
+    st = gen.bit_generator.state
+    return NP_RNG.pack(st["state"]["state"].to_bytes(16, "little"),
+                       st["state"]["inc"].to_bytes(16, "little"),
+                       st["has_uint32"], st["uinteger"])
+
+
+def unpack_np_rng(gen, data, offset):
+    state, inc, has_uint32, uinteger = NP_RNG.unpack_from(data, offset)
+    gen.bit_generator.state = {
+        "bit_generator": "PCG64",
+        "state": {"state": int.from_bytes(state, "little"),
+                  "inc": int.from_bytes(inc, "little")},
+        "has_uint32": has_uint32,
+        "uinteger": uinteger,
+    }
+    return offset + NP_RNG.size
+
+
+def capture(world, particles=True):
+    """Estado completo do World em bytes.
+
+    ``particles=False`` deixa as partículas de fora (são só visuais e
+    mudam todo frame); o rewind usa assim para o delta ficar pequeno.
+    """
+    ship = world.ship
+    ufos = world.ufos.sprites()
+    b, p, a = world.bullets, world.particles, world.asteroids
+    nb, np_, na = b.count, p.count if particles else 0, a.count
+
+    parts = [
+        HEADER.pack(
+            MAGIC, VERSION,
+            world.score, world.lives, world.wave, world.seed,
+            *(float(getattr(world, name)) for name in WORLD_FLOATS),
+            ship.pos.x, ship.pos.y, ship.prev_pos.x, ship.prev_pos.y,
+            ship.vel.x, ship.vel.y, ship.angle, ship.invuln, ship.timer,
+            ship.frame_index,
+            len(ufos), nb, np_, na, len(p.palette), len(world.scheduler.acc),
+        ),
+        pack_py_rng(world.rng),
+        pack_np_rng(p.rng),
+        pack_np_rng(a.rng),
+        np.array([world.scheduler.acc, world.scheduler.since], np.float64).tobytes(),
+        bytes(c for color in p.palette for c in color),
+        np.array([(u.pos.x, u.pos.y, u.prev_pos.x, u.prev_pos.y, u.dir.x, u.dir.y,
+                   u.speed, u.shoot_cool, u.timer, u.frame_index, u.small)
+                  for u in ufos], np.float64).tobytes(),
+        b.pos[:nb].tobytes(), b.vel[:nb].tobytes(), b.age[:nb].tobytes(),
+        b.owner[:nb].tobytes(),
+        p.pos[:np_].tobytes(), p.vel[:np_].tobytes(), p.ttl[:np_].tobytes(),
+        p.life[:np_].tobytes(), p.size[:np_].astype(np.uint8).tobytes(),
+        p.color[:np_].astype(np.uint8).tobytes(),
+        a.pos[:na].tobytes(), a.vel[:na].tobytes(),
+        a.size[:na].astype(np.uint8).tobytes(), a.variant[:na].astype(np.uint8).tobytes(),
+    ]
+    return b"".join(parts)
+
+
+class Reader:
+    def __init__(self, data, offset):
+        self.data = data
+        self.offset = offset
+
+    def array(self, dtype, n, cols=None):
+        dtype = np.dtype(dtype)
+        count = n * (cols or 1)
+        arr = np.frombuffer(self.data, dtype, count, self.offset)
+        self.offset += count * dtype.itemsize
+        return arr.reshape(n, cols) if cols else arr
+
+
+def restore(world, data, particles=True):
+    """Carrega um snapshot de ``capture`` no World (pools e sprites reaproveitados).
+
+    Com ``particles=False`` as partículas atuais ficam como estão.
+    """
+    (magic, version, world.score, world.lives, world.wave, world.seed,
+     *rest) = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"não é um snapshot v{VERSION}")
+
+    floats, rest = rest[:len(WORLD_FLOATS)], rest[len(WORLD_FLOATS):]
+    for name, value in zip(WORLD_FLOATS, floats):
+        setattr(world, name, value)
+    (sx, sy, px, py, vx, vy, angle, invuln, timer, frame,
+     n_ufos, nb, np_, na, n_colors, n_tasks) = rest
+    if n_tasks != len(world.scheduler.acc):
+        raise ValueError("snapshot de outra lista de subsistemas")
+
+    ship = world.ship
+    ship.pos.update(sx, sy)
+    ship.prev_pos.update(px, py)
+    ship.vel.update(vx, vy)
+    ship.angle, ship.invuln, ship.timer, ship.frame_index = angle, invuln, timer, frame
+    ship.refresh_image()
+
+    offset = unpack_py_rng(world.rng, data, HEADER.size)
+    offset = unpack_np_rng(world.particles.rng, data, offset)
+    offset = unpack_np_rng(world.asteroids.rng, data, offset)
+    acc = np.frombuffer(data, np.float64, 2 * n_tasks, offset)
+    world.scheduler.acc = acc[:n_tasks].tolist()
+    world.scheduler.since = acc[n_tasks:].tolist()
+    offset += acc.nbytes
+    # as cores viram índices da paleta deste World (pode ter outra ordem)
+    palette = data[offset:offset + 3 * n_colors]
+    offset += 3 * n_colors
+    remap = np.array([world.particles.color_index(tuple(palette[i:i + 3]))
+                      for i in range(0, len(palette), 3)] or [0], np.intp)
+
+    r = Reader(data, offset)
+    for spr in world.ufos.sprites():
+        spr.kill()
+    for row in r.array(np.float64, n_ufos, UFO_FIELDS).tolist():
+        x, y, px, py, dx, dy, speed, cool, timer, frame, small = row
+        ufo = UFO(Vec(x, y), small=bool(small), speed=speed, headless=world.headless)
+        ufo.prev_pos.update(px, py)
+        ufo.dir.update(dx, dy)
+        ufo.shoot_cool, ufo.timer, ufo.frame_index = cool, timer, int(frame)
+        ufo.refresh_image()
+        world.ufos.add(ufo)
+        world.all_sprites.add(ufo)
+
+    b = world.bullets
+    b.count = nb
+    b.pos[:nb] = r.array(np.float32, nb, 2)
+    b.vel[:nb] = r.array(np.float32, nb, 2)
+    b.age[:nb] = r.array(np.float32, nb)
+    b.owner[:nb] = r.array(np.int8, nb)
+
+    p = world.particles
+    pos, vel = r.array(np.float32, np_, 2), r.array(np.float32, np_, 2)
+    ttl, life = r.array(np.float32, np_), r.array(np.float32, np_)
+    size, color = r.array(np.uint8, np_), r.array(np.uint8, np_)
+    if particles:
+        p.count = np_
+        p.pos[:np_], p.vel[:np_] = pos, vel
+        p.ttl[:np_], p.life[:np_] = ttl, life
+        p.size[:np_] = size
+        p.color[:np_] = remap[color]
+
+    a = world.asteroids
+    a.count = na
+    a.pos[:na] = r.array(np.float32, na, 2)
+    a.vel[:na] = r.array(np.float32, na, 2)
+    a.size[:na] = r.array(np.uint8, na)
+    a.variant[:na] = r.array(np.uint8, na)
+
+    world.ufo_shots = None
+    world.grid.clear()
+
+
+def save(world, path):
+    with open(path, "wb") as f:
+        f.write(zlib.compress(capture(world), 6))
+
+
+def load(world, path):
+    with open(path, "rb") as f:
+        restore(world, zlib.decompress(f.read()))
+
+
+class RewindBuffer:
+    """Últimos snapshots num bloco de memória fixo (``capacity`` bytes).
+
+    Escreve em anel: quando falta espaço, os mais antigos saem. Com
+    ``keyframe`` > 1, só um a cada ``keyframe`` snapshots é guardado
+    inteiro; os demais guardam o XOR contra esse keyframe, só os blocos
+    de ``BLOCK`` bytes que não zeraram (índices uint32 + blocos). Sem
+    zlib: o push roda todo frame e precisa caber em bem menos de 1 ms.
+    """
+
+    BLOCK = 64
+
+    def __init__(self, capacity=C.REWIND_BYTES, keyframe=C.REWIND_KEYFRAME,
+                 max_frames=C.REWIND_SECONDS * C.FPS):
+        self.buf = np.zeros(capacity, np.uint8)
+        self.capacity = capacity
+        self.keyframe = keyframe
+        self.entries = deque()   # (início, tamanho, tamanho original, é keyframe)
+        self.max_frames = max_frames
+        self.head = 0            # próxima posição livre no anel
+        self.key = None          # keyframe atual (np.uint8) para os deltas
+        self.since_key = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.entries.clear()
+        self.head = 0
+        self.key = None
+        self.since_key = 0
+
+    def push(self, data):
+        raw = np.frombuffer(data, np.uint8)
+        is_key = self.key is None or self.since_key >= self.keyframe - 1 or self.keyframe <= 1
+        if is_key:
+            blob = raw
+            self.key = raw
+            self.since_key = 0
+        else:
+            blob = self.encode(raw)
+            self.since_key += 1
+
+        size = len(blob)
+        if size > self.capacity:
+            return False
+        if self.head + size > self.capacity:
+            # volta ao início do anel; o que sobrou no fim é o mais antigo
+            self.evict(self.head, self.capacity)
+            self.head = 0
+        self.evict(self.head, self.head + size)
+        self.buf[self.head:self.head + size] = blob
+        self.entries.append((self.head, size, len(raw), is_key))
+        self.head += size
+
+        while len(self.entries) > self.max_frames:
+            self.entries.popleft()
+        self.drop_orphans()
+        return True
+
+    def blocks(self, length, key):
+        # tamanho do delta em blocos inteiros (cobre o snapshot e o keyframe)
+        return -(-max(length, len(key)) // self.BLOCK)
+
+    def encode(self, raw):
+        key = self.key
+        out = np.zeros(self.blocks(len(raw), key) * self.BLOCK, np.uint8)
+        out[:len(raw)] = raw
+        out[:len(key)] ^= key
+        rows = out.reshape(-1, self.BLOCK)
+        used = np.flatnonzero(rows.view(np.uint64).any(axis=1)).astype(np.uint32)
+        return np.concatenate((used.view(np.uint8), rows[used].ravel()))
+
+    def decode(self, blob, length, key):
+        k = len(blob) // (4 + self.BLOCK)
+        used = blob[:4 * k].copy().view(np.uint32)
+        out = np.zeros((self.blocks(length, key), self.BLOCK), np.uint8)
+        out[used] = blob[4 * k:].reshape(k, self.BLOCK)
+        out = out.ravel()
+        out[:len(key)] ^= key
+        return out[:length].tobytes()
+
+    def evict(self, start, end):
+        # remove do início da fila tudo que a nova escrita vai sobrescrever
+        while self.entries:
+            s, size, _, _ = self.entries[0]
+            if s < end and start < s + size:
+                self.entries.popleft()
+            else:
+                break
+
+    def drop_orphans(self):
+        # deltas sem o keyframe deles não servem mais
+        while self.entries and not self.entries[0][3]:
+            self.entries.popleft()
+
+    def pop(self):
+        """Tira e retorna o snapshot mais recente (None se vazio)."""
+        if not self.entries:
+            return None
+        start, size, length, is_key = self.entries.pop()
+        blob = self.buf[start:start + size]
+
+        # acha o keyframe deste delta (o mais recente que ainda está na fila)
+        if is_key:
+            data = blob.tobytes()
+        else:
+            ks, ksize, _, _ = next(e for e in reversed(self.entries) if e[3])
+            data = self.decode(blob, length, self.buf[ks:ks + ksize])
+
+        self.head = start
+        self.restart_key()
+        return data
+
+    def restart_key(self):
+        # próximos push fazem delta contra o último keyframe que sobrou
+        self.key = None
+        self.since_key = 0
+        for i in range(len(self.entries) - 1, -1, -1):
+            s, size, _, is_key = self.entries[i]
+            if is_key:
+                self.key = self.buf[s:s + size].copy()
+                self.since_key = len(self.entries) - 1 - i
+                break
+
+    def memory(self):
+        return sum(size for _, size, _, _ in self.entries)
@@ -1,5 +1,6 @@
 import pygame as pg
 import os
+from collections import Counter
 
 MASTER_VOLUME = 0.5
 
@@ -13,6 +14,22 @@ SND_HIPER = "assets/sounds/hiper_sound.mp3"
 MUSIC_INTRO = "assets/sounds/Intro Stage.mp3"
 MUSIC_TRACK = "assets/sounds/guardian.mp3"
 
+# efeito -> (arquivo, categoria, intervalo mínimo entre disparos em ms)
+EFFECTS = {
+    "player_shoot": (SND_PLAYER_SHOOT, "player", 0),
+    "hiper_sound": (SND_HIPER, "player", 0),
+    "player_death": (SND_PLAYER_DEATH, "player", 0),
+    "ufo_shoot": (SND_UFO_SHOOT, "ufo", 60),
+    "ufo_appear": (SND_UFO_APPEAR, "ufo", 150),
+    "ufo_death": (SND_UFO_DEATH, "explosion", 40),
+    "asteroid_explosion": (SND_A_DESTROY, "explosion", 40),
+}
+# canais reservados por categoria; o total é fixo, haja quantos UFOs houver
+CHANNELS = {"player": 2, "ufo": 3, "explosion": 3}
+# volume do canal numa voz simples; cada cópia fundida no frame soma MERGE_BOOST
+VOICE_VOLUME = 0.7
+MERGE_BOOST = 0.1
+
 BASE = os.path.dirname(os.path.abspath(__file__))
 
 def path(p):
@@ -20,69 +37,149 @@ def path(p):
 
 
 class SoundManager:
-    def __init__(self):
-        pg.mixer.init()
-        self.load_sounds()
+    """Efeitos em canais reservados por categoria.
+
+    ``play(nome)`` funde repetições do mesmo efeito no frame (só aumenta o
+    volume), ignora disparos mais frequentes que o intervalo do efeito e,
+    com a categoria cheia, rouba o canal tocando há mais tempo. O Game
+    chama ``tick()`` uma vez por frame.
+    """
+
+    def __init__(self, load=True):
+        # um único mixer por processo; reusa se alguém já o iniciou
+        if not pg.mixer.get_init():
+            pg.mixer.init()
+        self.stats = Counter()
+        self.last = {}     # efeito -> ticks do último disparo
+        self.frame = {}    # efeito -> (canal, cópias) disparados neste frame
+        self.effects = {}  # vazio até load_sounds(): play() vira no-op
+        self.setup_channels()
+        # load=False: quem chama decodifica depois (ex.: o AssetLoader)
+        if load:
+            self.load_sounds()
+
+    def setup_channels(self):
+        total = sum(CHANNELS.values())
+        pg.mixer.set_num_channels(max(total, pg.mixer.get_num_channels()))
+        pg.mixer.set_reserved(total)  # fora do alcance do Sound.play() automático
+        self.channels = {}
+        self.started = {}  # canal -> ticks em que começou a tocar
+        i = 0
+        for cat, n in CHANNELS.items():
+            self.channels[cat] = [pg.mixer.Channel(i + k) for k in range(n)]
+            i += n
 
     def load_sounds(self):
-        self.player_shoot = self.load_effect(SND_PLAYER_SHOOT)
-        self.ufo_shoot = self.load_effect(SND_UFO_SHOOT)
-        self.asteroid_explosion = self.load_effect(SND_A_DESTROY)
-        self.ufo_appear = self.load_effect(SND_UFO_APPEAR)
-        self.ufo_death = self.load_effect(SND_UFO_DEATH)
-        self.player_death = self.load_effect(SND_PLAYER_DEATH)
-        self.hiper_sound = self.load_effect(SND_HIPER)
+        self.effects = {name: self.load_effect(file) for name, (file, _, _) in EFFECTS.items()}
+
+    def play(self, name):
+        snd = self.effects.get(name)
+        if snd is None:
+            return
+
+        # mesmo efeito no mesmo frame: uma voz só, um pouco mais alta
+        merged = self.frame.get(name)
+        if merged is not None:
+            chan, copies = merged
+            copies += 1
+            self.frame[name] = (chan, copies)
+            chan.set_volume(min(1.0, VOICE_VOLUME + MERGE_BOOST * (copies - 1)))
+            self.stats["merged"] += 1
+            return
+
+        _, cat, interval = EFFECTS[name]
+        now = pg.time.get_ticks()
+        if now - self.last.get(name, -interval) < interval:
+            self.stats["dropped"] += 1
+            return
+
+        chans = self.channels[cat]
+        chan = next((c for c in chans if not c.get_busy()), None)
+        if chan is None:
+            chan = min(chans, key=lambda c: self.started.get(c, 0))
+            chan.stop()
+            self.stats["stolen"] += 1
+
+        chan.set_volume(VOICE_VOLUME)
+        chan.play(snd)
+        self.started[chan] = now
+        self.last[name] = now
+        self.frame[name] = (chan, 1)
+        self.stats["played"] += 1
+
+    def tick(self):
+        """Fim do frame: novos disparos voltam a ocupar vozes próprias."""
+        self.frame.clear()
 
     def load_effect(self, file):
         try:
             snd = pg.mixer.Sound(path(file))
-            snd.set_volume(MASTER_VOLUME)
+            # compensa VOICE_VOLUME: uma voz simples sai em MASTER_VOLUME
+            snd.set_volume(min(1.0, MASTER_VOLUME / VOICE_VOLUME))
             return snd
         except Exception as e:
             print(f"Falha ao carregar: {file} -> {e}")
             return None
 
-    # 🎵 INTRO
-    def play_intro(self):
+    def play_music(self, file, volume):
         pg.mixer.music.stop()
-        pg.mixer.music.load(path(MUSIC_INTRO))
-        pg.mixer.music.set_volume(0.4)
+        try:
+            pg.mixer.music.load(path(file))
+        except Exception as e:
+            print(f"Falha ao carregar: {file} -> {e}")
+            return
+        pg.mixer.music.set_volume(volume)
         pg.mixer.music.play(-1)
 
+    # 🎵 INTRO
+    def play_intro(self):
+        self.play_music(MUSIC_INTRO, 0.4)
+
     # 🎮 GAME TRACK
     def play_track(self):
-        pg.mixer.music.stop()
-        pg.mixer.music.load(path(MUSIC_TRACK))
-        pg.mixer.music.set_volume(0.2)
-        pg.mixer.music.play(-1)
+        self.play_music(MUSIC_TRACK, 0.2)
 
     def stop_music(self):
         pg.mixer.music.stop()
 
     def play_player_shoot(self):
-        if self.player_shoot:
-            self.player_shoot.play()
+        self.play("player_shoot")
 
     def play_hiper_sound(self):
-        if self.hiper_sound:
-            self.hiper_sound.play()
+        self.play("hiper_sound")
 
     def play_ufo_shoot(self):
-        if self.ufo_shoot:
-            self.ufo_shoot.play()
+        self.play("ufo_shoot")
 
     def play_asteroid_explosion(self):
-        if self.asteroid_explosion:
-            self.asteroid_explosion.play()
+        self.play("asteroid_explosion")
 
     def play_ufo_appear(self):
-        if self.ufo_appear:
-            self.ufo_appear.play()
+        self.play("ufo_appear")
 
     def play_ufo_death(self):
-        if self.ufo_death:
-            self.ufo_death.play()
+        self.play("ufo_death")
 
     def play_player_death(self):
-        if self.player_death:
-            self.player_death.play()
+        self.play("player_death")
+
+
+class NullSound(SoundManager):
+    """SoundManager sem mixer nem arquivos: tudo vira no-op (modo headless)."""
+
+    def __init__(self):
+        self.stats = Counter()
+        self.frame = {}
+        self.load_sounds()
+
+    def load_effect(self, file):
+        return None
+
+    def play(self, name):
+        pass
+
+    def play_music(self, file, volume):
+        pass
+
+    def stop_music(self):
+        pass
@@ -0,0 +1,173 @@
+import pygame as pg
+import numpy as np
+
+import config as C
+
+
+class SpatialHash:
+    """Grade uniforme para broadphase de colisões num mundo toroidal.
+
+    O tamanho da célula é pelo menos ``2 * max_radius``, então dois objetos
+    que se tocam estão sempre em células vizinhas (3x3, com wrap nas
+    bordas como ``utils.wrap_pos``). A grade é reconstruída a cada frame.
+
+    Categorias pequenas (nave, UFOs, tiros) ficam em listas por célula e
+    são cruzadas com ``pairs``. Categorias grandes vindas de um pool
+    (asteroides) entram com ``index`` — só os índices ordenados por
+    célula — e são consultadas em lote com ``query``.
+    """
+
+    def __init__(self, max_radius, width=C.WIDTH, height=C.HEIGHT):
+        self.width = width
+        self.height = height
+        cell = 2 * max_radius
+        self.cols = max(1, int(width // cell))
+        self.rows = max(1, int(height // cell))
+        self.cell_w = width / self.cols
+        self.cell_h = height / self.rows
+        self.size = np.array([width, height], np.float32)
+
+        # categoria -> {(col, row): [(chave, x, y, r), ...]}
+        self.buckets = {}
+        # categoria -> (linhas ordenadas por célula, início de cada célula,
+        #               pos e r já nessa ordem)
+        self.arrays = {}
+        self.neighbors = {}
+        # vizinhas de cada célula (id = row * cols + col), -1 completa as 9
+        self.neighbor_ids = np.full((self.cols * self.rows, 9), -1, np.intp)
+        for col in range(self.cols):
+            for row in range(self.rows):
+                cells = list({
+                    ((col + dc) % self.cols, (row + dr) % self.rows)
+                    for dc in (-1, 0, 1) for dr in (-1, 0, 1)
+                })
+                self.neighbors[(col, row)] = cells
+                ids = [r * self.cols + c for c, r in cells]
+                self.neighbor_ids[row * self.cols + col, :len(ids)] = ids
+
+    def clear(self):
+        self.buckets.clear()
+        self.arrays.clear()
+
+    def cell_of(self, x, y):
+        return (int(x % self.width // self.cell_w) % self.cols,
+                int(y % self.height // self.cell_h) % self.rows)
+
+    def insert(self, category, key, x, y, r):
+        cells = self.buckets.setdefault(category, {})
+        cells.setdefault(self.cell_of(x, y), []).append((key, x, y, r))
+
+    def insert_many(self, category, keys, pos, r):
+        """Insere vários objetos (pos Nx2) com o mesmo raio ``r``."""
+        if len(keys) == 0:
+            return
+        cols = (np.mod(pos[:, 0], self.width) // self.cell_w).astype(np.intp) % self.cols
+        rows = (np.mod(pos[:, 1], self.height) // self.cell_h).astype(np.intp) % self.rows
+        cells = self.buckets.setdefault(category, {})
+        for key, col, row, (x, y) in zip(keys, cols.tolist(), rows.tolist(), pos.tolist()):
+            cells.setdefault((col, row), []).append((key, x, y, r))
+
+    def cell_ids(self, pos):
+        # floor antes do % inteiro: vale também fora da tela (wrap)
+        cols = np.floor(pos[:, 0] / self.cell_w).astype(np.intp) % self.cols
+        rows = np.floor(pos[:, 1] / self.cell_h).astype(np.intp) % self.rows
+        return rows * self.cols + cols
+
+    def index(self, category, pos, r):
+        """Indexa as linhas de ``pos`` (Nx2); ``r`` é escalar ou array N.
+
+        Guarda uma cópia ordenada por célula: refaça se o pool mudar.
+        """
+        cells = self.cell_ids(pos)
+        order = np.argsort(cells, kind="stable")
+        starts = np.searchsorted(cells[order], np.arange(self.cols * self.rows + 1))
+        r = np.take(np.broadcast_to(r, len(pos)), order)
+        self.arrays[category] = (order, starts, np.take(pos, order, axis=0), r)
+
+    def query(self, category, points, r):
+        """Sobreposições de ``points`` (Nx2, raio ``r``) com uma categoria indexada.
+
+        Retorna (índices dos pontos, linhas da categoria), em ordem de ponto.
+        """
+        empty = np.empty(0, np.intp)
+        entry = self.arrays.get(category)
+        if entry is None or len(points) == 0:
+            return empty, empty
+        order, starts, pos, radius = entry
+
+        # blocos de candidatos: cada ponto x cada uma das suas 9 células vizinhas
+        nb = self.neighbor_ids[self.cell_ids(points)]
+        valid = nb >= 0
+        nb = np.where(valid, nb, 0)
+        lo = starts[nb]
+        count = np.where(valid, starts[nb + 1] - lo, 0).ravel()
+        total = int(count.sum())
+        if total == 0:
+            return empty, empty
+
+        # posição de cada candidato nos arrays ordenados
+        cand = np.arange(total) + np.repeat(lo.ravel() - (np.cumsum(count) - count), count)
+        point = np.repeat(np.arange(len(points)), count.reshape(-1, 9).sum(axis=1))
+
+        # distância ao quadrado, pelo caminho mais curto no toro
+        # (np.take: bem mais rápido que indexar linhas com points[point])
+        d = np.abs(np.take(points, point, axis=0) - np.take(pos, cand, axis=0))
+        np.minimum(d, self.size - d, out=d)
+        d *= d
+        rr = np.take(radius, cand) + r
+        hit = d[:, 0] + d[:, 1] < rr * rr
+        return point[hit], order[cand[hit]]
+
+    def pairs(self, cat_a, cat_b):
+        """Pares (chave_a, chave_b) de objetos que se sobrepõem."""
+        cells_a = self.buckets.get(cat_a)
+        cells_b = self.buckets.get(cat_b)
+        if not cells_a or not cells_b:
+            return []
+
+        w, h = self.width, self.height
+        half_w, half_h = w / 2, h / 2
+        out = []
+        for cell, items in cells_a.items():
+            for ncell in self.neighbors[cell]:
+                others = cells_b.get(ncell)
+                if not others:
+                    continue
+                for ka, xa, ya, ra in items:
+                    for kb, xb, yb, rb in others:
+                        # distância ao quadrado, pelo caminho mais curto no toro
+                        dx = abs(xa - xb)
+                        if dx > half_w:
+                            dx = w - dx
+                        dy = abs(ya - yb)
+                        if dy > half_h:
+                            dy = h - dy
+                        rr = ra + rb
+                        if dx * dx + dy * dy < rr * rr:
+                            out.append((ka, kb))
+        return out
+
+    def occupancy(self):
+        """Quantidade de objetos por célula (array rows x cols)."""
+        grid = np.zeros((self.rows, self.cols), np.int32)
+        for _, starts, _, _ in self.arrays.values():
+            grid += np.diff(starts).reshape(self.rows, self.cols).astype(np.int32)
+        for cells in self.buckets.values():
+            for (col, row), items in cells.items():
+                grid[row, col] += len(items)
+        return grid
+
+    def draw_debug(self, surf):
+        occ = self.occupancy()
+        peak = max(1, int(occ.max()))
+        overlay = pg.Surface((int(self.cell_w), int(self.cell_h)), pg.SRCALPHA)
+        for row, col in zip(*np.nonzero(occ)):
+            overlay.fill((255, 60, 60, 40 + 160 * int(occ[row, col]) // peak))
+            surf.blit(overlay, (int(col * self.cell_w), int(row * self.cell_h)))
+
+        for col in range(1, self.cols):
+            x = int(col * self.cell_w)
+            pg.draw.line(surf, C.GRAY, (x, 0), (x, self.height))
+        for row in range(1, self.rows):
+            y = int(row * self.cell_h)
+            pg.draw.line(surf, C.GRAY, (0, y), (self.width, y))
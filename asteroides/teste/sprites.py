@@ -1,67 +1,102 @@
 import pygame as pg
-from PIL import Image
-from utils import Vec
+from assets import ASSETS
+from utils import Vec, lerp_wrap, wrap_pos
+import config as C
 import math
 import random
 
-def load_gif(path, scale=1):
-    gif = Image.open(path)
-    frames = []
-
-    for frame in range(gif.n_frames):
-        gif.seek(frame)
-        frame_img = gif.convert("RGBA")
-        frame_pg = pg.image.fromstring(frame_img.tobytes(), frame_img.size, "RGBA")
-
-        if scale != 1:
-            w = int(frame_pg.get_width() * scale)
-            h = int(frame_pg.get_height() * scale)
-            frame_pg = pg.transform.scale(frame_pg, (w, h))
-
-        frames.append(frame_pg)
-
-    return frames
-
+SHIP_GIF = "assets/ship.gif"
+UFO_GIF = "assets/ufo.gif"
+BACKGROUND = "assets/background.png"
+SPRITE_SCALE = 1.2
+SHIP_BASE_ANGLE = 90  # o desenho do GIF da nave aponta para cima
+# GIFs animados e escalas usados; viram spritesheets no cache (--bake-assets)
+ANIMATED = [(SHIP_GIF, SPRITE_SCALE), (UFO_GIF, SPRITE_SCALE)]
 
 class AnimatedSprite(pg.sprite.Sprite):
-    def __init__(self, pos, gif_path, scale=1, fps=12):
+    # fração da taxa de animação (o QualityGovernor reduz sob carga)
+    anim_scale = 1.0
+
+    def __init__(self, pos, gif_path, scale=1, fps=12, rot_step=None, base_angle=0,
+                 headless=False):
         super().__init__()
-        self.frames = load_gif(gif_path, scale)
+        # frames compartilhados entre todos os sprites do mesmo asset
+        # (headless: um frame vazio, nada é decodificado)
+        self.frames = ASSETS.get_frames(gif_path, scale, headless)
         self.frame_index = 0
         self.fps = fps
         self.timer = 0
         self.pos = Vec(pos)
+        self.prev_pos = Vec(pos)  # posição no passo anterior (interpolação)
+        self.angle = 0
+
+        # sprites que giram usam o atlas de rotação (rot_step em graus)
+        self.atlas = None
+        if rot_step:
+            self.atlas = ASSETS.get_atlas(gif_path, scale, rot_step, base_angle, headless)
+
         self.image = self.frames[0]
         self.rect = self.image.get_rect(center=self.pos)
+        self.refresh_image()
 
-    def update(self, dt):
+    def refresh_image(self):
+        if self.atlas:
+            self.image = self.atlas.image(self.frame_index, self.angle)
+            self.atlas.place(self.rect, self.frame_index, self.angle, self.pos)
+        else:
+            self.image = self.frames[self.frame_index]
+            self.rect.size = self.image.get_size()
+            self.rect.center = self.pos
+
+    def animate(self, dt):
+        # chamado pelo subsistema de animação do World, na taxa dele
         self.timer += dt
-        if self.timer >= (1 / self.fps):
+        if self.timer >= 1 / (self.fps * AnimatedSprite.anim_scale):
             self.timer = 0
             self.frame_index = (self.frame_index + 1) % len(self.frames)
-            self.image = self.frames[self.frame_index]
-            self.rect = self.image.get_rect(center=self.pos)
+            self.refresh_image()
 
-    def draw(self, surf):
-        surf.blit(self.image, self.rect.topleft)
+    def draw(self, surf, alpha=1.0):
+        # alpha: fração entre o passo de simulação anterior e o atual
+        x, y = lerp_wrap(self.prev_pos, self.pos, alpha)
+        return surf.blit(self.image, (int(x - self.rect.width / 2), int(y - self.rect.height / 2)))
 
 
 # 🔥 Nave com animação
 class Ship(AnimatedSprite):
-    def __init__(self, pos):
-        super().__init__(pos, "assets/ship.gif", scale=1.2)
+    def __init__(self, pos, headless=False):
+        super().__init__(pos, SHIP_GIF, scale=SPRITE_SCALE,
+                         rot_step=C.SHIP_ROT_STEP, base_angle=SHIP_BASE_ANGLE,
+                         headless=headless)
         self.vel = Vec(0, 0)
         self.angle = 0
         self.thrust = 0
-        self.rotation_speed = 180  # graus por segundo
-        self.acceleration = 200    # pixels por segundo²
-        self.max_speed = 300       # velocidade máxima
-        self.drag = 0.98
+        self.rotation_speed = C.SHIP_TURN_SPEED
+        self.acceleration = C.SHIP_THRUST
+        self.max_speed = C.SHIP_MAX_SPEED
+        self.drag = C.SHIP_FRICTION
+        self.r = C.SHIP_RADIUS
+        self.invuln = 0.0  # segundos de invulnerabilidade restantes
+
+    def reset(self, pos):
+        """Estado inicial de uma nova partida (mantém frames e atlas)."""
+        self.pos.update(pos)
+        self.prev_pos.update(pos)
+        self.vel.update(0, 0)
+        self.angle = 0
+        self.thrust = 0
+        self.invuln = 0.0
+        self.frame_index = 0
+        self.timer = 0
+        self.refresh_image()
+
+    def update(self, dt):
+        if self.invuln > 0:
+            self.invuln = max(0.0, self.invuln - dt)
 
     def rotate(self, angle):
-        self.angle += angle
-        self.image = pg.transform.rotate(self.frames[self.frame_index], -self.angle)
-        self.rect = self.image.get_rect(center=self.pos)
+        self.angle = (self.angle + angle) % 360
+        self.refresh_image()
     
     def control(self, keys, dt):
         """Controla a nave baseado nas teclas pressionadas"""
@@ -88,8 +123,8 @@ class Ship(AnimatedSprite):
         else:
             self.thrust = 0
             
-        # Aplicar fricção/drag
-        self.vel *= self.drag
+        # Aplicar fricção/drag (drag é por 1/FPS s, independe de SIM_HZ)
+        self.vel *= self.drag ** (dt * C.FPS)
         
         # Atualizar posição
         self.pos += self.vel * dt
@@ -98,122 +133,28 @@ class Ship(AnimatedSprite):
         self.rect.center = self.pos.xy
         
         # Wrap-around (teleporte nas bordas)
-        screen_width = 800  # Ajuste conforme sua tela
-        screen_height = 600  # Ajuste conforme sua tela
-        
-        if self.pos.x < 0:
-            self.pos.x = screen_width
-        elif self.pos.x > screen_width:
-            self.pos.x = 0
-            
-        if self.pos.y < 0:
-            self.pos.y = screen_height
-        elif self.pos.y > screen_height:
-            self.pos.y = 0
-            
+        self.pos = wrap_pos(self.pos)
         self.rect.center = self.pos.xy
-    
-        def shoot(self):
 
-            rad_angle = math.radians(self.angle)
-            direction = Vec(math.cos(rad_angle), -math.sin(rad_angle))
-            bullet_pos = self.pos + direction * 20  # 20 pixels à frente da nave
-            return Bullet(bullet_pos, direction, owner="ship")
+    def fire(self):
+        """Retorna (posição, velocidade) de um novo tiro."""
+        rad_angle = math.radians(self.angle)
+        direction = Vec(math.cos(rad_angle), -math.sin(rad_angle))
+        bullet_pos = self.pos + direction * C.SHIP_MUZZLE
+        return bullet_pos, direction * C.SHIP_BULLET_SPEED
 
 
 # 👾 UFO animado
 class UFO(AnimatedSprite):
-    def __init__(self, pos, speed):
-        super().__init__(pos, "assets/ufo.gif", scale=1.2)
+    def __init__(self, pos, small=True, speed=C.UFO_SPEED, headless=False):
+        super().__init__(pos, UFO_GIF, scale=SPRITE_SCALE, headless=headless)
+        self.small = small
+        self.r = C.UFO_SMALL["r"] if small else C.UFO_BIG["r"]
         self.speed = speed
+        self.dir = Vec(1, 0)      # definido pela IA do World
+        self.shoot_cool = 0.0
 
     def update(self, dt):
-        super().update(dt)
-        self.pos.x += self.speed * dt
+        self.pos += self.dir * (self.speed * dt)
+        self.pos = wrap_pos(self.pos)
         self.rect.center = self.pos.xy
-
-# ðŸ”¥ Bala para nave e UFO
-class Bullet(pg.sprite.Sprite):
-    def __init__(self, pos, direction, speed=500, owner="ship"):
-        super().__init__()
-        self.pos = Vec(pos)
-        self.vel = Vec(direction).normalize() * speed
-        self.owner = owner  # "ship" ou "ufo" para identificar quem atirou
-        
-        # Criar uma bala simples (pode personalizar depois)
-        self.image = pg.Surface((4, 4), pg.SRCALPHA)
-        
-        # Cor diferente para cada dono
-        if owner == "ship":
-            pg.draw.circle(self.image, (255, 255, 255), (2, 2), 2)  # Branco para nave
-        else:
-            pg.draw.circle(self.image, (255, 100, 100), (2, 2), 2)  # Vermelho para UFO
-            
-        self.rect = self.image.get_rect(center=self.pos.xy)
-        self.lifetime = 2.0  # 2 segundos de vida
-        self.time_alive = 0
-        
-    def update(self, dt):
-        # Atualizar posição
-        self.pos += self.vel * dt
-        self.rect.center = self.pos.xy
-        
-        # Atualizar tempo de vida
-        self.time_alive += dt
-        if self.time_alive >= self.lifetime:
-            self.kill()  # Remove a bala quando o tempo acaba
-            
-        # Verificar limites da tela (wrap-around como no Asteroids)
-        screen_width = 800  # Ajuste conforme o tamanho da sua tela
-        screen_height = 600
-        
-        if self.pos.x < 0:
-            self.pos.x = screen_width
-        elif self.pos.x > screen_width:
-            self.pos.x = 0
-            
-        if self.pos.y < 0:
-            self.pos.y = screen_height
-        elif self.pos.y > screen_height:
-            self.pos.y = 0
-            
-        self.rect.center = self.pos.xy
-        
-    def draw(self, surf):
-        surf.blit(self.image, self.rect.topleft)
-
-# ✨ Partículas para efeitos (explosões, propulsão, etc.)
-class Particle(pg.sprite.Sprite):
-    def __init__(self, pos, velocity, color=(255, 255, 255), size=3, lifetime=1.0):
-        super().__init__()
-        self.pos = Vec(pos)
-        self.vel = Vec(velocity)
-        self.color = color
-        self.size = size
-        self.lifetime = lifetime
-        self.time_alive = 0
-        
-        # Criar partícula redonda
-        self.image = pg.Surface((size*2, size*2), pg.SRCALPHA)
-        pg.draw.circle(self.image, color, (size, size), size)
-        self.rect = self.image.get_rect(center=self.pos.xy)
-        
-    def update(self, dt):
-        # Atualizar posição com velocidade
-        self.pos += self.vel * dt
-        self.rect.center = self.pos.xy
-        
-        # Atualizar tempo de vida
-        self.time_alive += dt
-        
-        # Efeito de fade out
-        alpha = max(0, int(255 * (1 - self.time_alive / self.lifetime)))
-        if alpha <= 0:
-            self.kill()
-            return
-            
-        # Atualizar transparência
-        self.image.set_alpha(alpha)
-        
-    def draw(self, surf):
-        surf.blit(self.image, self.rect.topleft)
\ No newline at end of file
@@ -1,14 +1,20 @@
-import math 
 import random
-from random import uniform
 
+import numpy as np
 import pygame as pg
 
 import config as C
-from sprites import Ship, UFO, Bullet
-from utils import Vec, rand_edge_pos, rand_unit_vec
-from sound import SoundManager
-from sprites import Particle
+from assets import ASSETS, TEXT
+from asteroids import AsteroidField, RADIUS as AST_RADIUS, SCORE as AST_SCORE
+from bullets import BulletPool, OWNER_SHIP, OWNER_UFO
+from sprites import Ship, UFO, UFO_GIF, SPRITE_SCALE, BACKGROUND
+from utils import Vec, rand_edge_pos
+from sound import SoundManager, NullSound
+from particles import ParticleSystem
+from quality import FULL as FULL_QUALITY
+from scheduler import Scheduler
+from spatial import SpatialHash
+from ufo_ai import steer_and_fire
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -16,64 +22,121 @@ if TYPE_CHECKING:
 
 
 class World:
-    def __init__(self, game):
+    def __init__(self, game, headless=False, seed=None, sound=None):
         self.game = game  
 
+        # headless: sem janela, sem mixer e sem decodificar assets
+        # (vale só para este World; o ASSETS global não muda)
+        self.headless = headless
+
+        # decodifica o UFO agora, e não no frame em que ele aparece
+        if not headless:
+            ASSETS.preload((UFO_GIF, SPRITE_SCALE))
+
         # Ship e grupos
-        self.ship = Ship(Vec(C.WIDTH / 2, C.HEIGHT / 2))
-        self.bullets = pg.sprite.Group()
-        self.ufo_bullets = pg.sprite.Group()
+        self.ship = Ship(Vec(C.WIDTH / 2, C.HEIGHT / 2), headless=headless)
+        # tiros da nave e dos UFOs (campo owner diferencia)
+        self.bullets = BulletPool()
 
-        # Asteroides removidos (não usados)
-        # self.asteroids = pg.sprite.Group()
+        # asteroides (AST_SIZES) em lote, fora dos grupos de sprites
+        self.asteroids = AsteroidField()
 
         self.ufos = pg.sprite.Group()
-        self.particles = pg.sprite.Group()
+        self.particles = ParticleSystem()
 
         # all_sprites para facilitar update/draw
         self.all_sprites = pg.sprite.Group(self.ship)
-        
-        # controles (setados pelo game)
-        self.rt_accel = False
-        self.dpad_up = False
 
+        # o Game passa o seu SoundManager: um só mixer para o processo todo
+        if sound is None:
+            sound = NullSound() if headless else SoundManager()
+        self.sound = sound
+
+        # broadphase de colisões (célula >= maior raio de colisão * 2)
+        self.grid = SpatialHash(max(C.SHIP_RADIUS, C.UFO_BIG["r"], C.UFO_SMALL["r"],
+                                    C.BULLET_RADIUS, int(AST_RADIUS.max())))
+        self.debug_grid = False
+
+        # FrameProfiler opcional: marca o fim de cada etapa do update
+        self.profiler = None
+
+        # subsistemas do update, cada um na sua taxa
+        self.scheduler = Scheduler()
+        self.add_subsystems()
+        self.keys = None
+
+        # nível de qualidade visual (o Game troca conforme o QualityGovernor)
+        self.quality = FULL_QUALITY
+
+        # -------------------------
+        # Background (carrega com fallback)
+        # -------------------------
+        self.bg = None if headless else self.load_background()
+
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Volta ao início da partida reaproveitando pools, sprites e assets."""
+        # RNG próprio: mesma seed + mesmas entradas = mesma partida
+        if seed is None:
+            seed = C.RANDOM_SEED
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.particles.rng = np.random.default_rng(self.rng.getrandbits(64))
+        self.asteroids.rng = np.random.default_rng(self.rng.getrandbits(64))
+
+        self.ship.reset(Vec(C.WIDTH / 2, C.HEIGHT / 2))
+        self.bullets.clear()
+        self.particles.clear()
+        self.asteroids.clear()
+        self.ufos.empty()
+        self.all_sprites.empty()
+        self.all_sprites.add(self.ship)
+        self.grid.clear()
+        self.scheduler.reset()
+        
         # estado do jogo
         self.score = 0
         self.lives = C.START_LIVES
+        self.hyperspace_cd = 0
 
         # NOVO SISTEMA DE HORDAS
         self.wave = 1
         self.wave_timer = 0
-        self.time_between_waves = 4.0
+        self.time_between_waves = C.WAVE_BREAK
 
         # Atributos de dificuldade progressiva
-        self.ufo_spawn_rate = 0.015
+        self.ufo_spawn_rate = C.UFO_SPAWN_RATE
         self.ufo_speed_mult = 1.0
 
         self.wave_cool = C.WAVE_DELAY
         self.safe = C.SAFE_SPAWN_TIME
         self.ufo_timer = C.UFO_SPAWN_EVERY
 
-        self.sound = SoundManager()
+        # duração do último passo de simulação (usada na interpolação)
+        self.step_dt = 0.0
 
-        # -------------------------
-        # Background (carrega com fallback)
-        # -------------------------
+        # tiros decididos pela IA dos UFOs neste frame: (posições, velocidades)
+        self.ufo_shots = None
+
+        self.spawn_asteroids()
+
+    def load_background(self):
         try:
-            self.bg = pg.image.load("assets/background.png").convert()
-            # garantir tamanho correto
-            if self.bg.get_size() != (C.WIDTH, C.HEIGHT):
-                self.bg = pg.transform.scale(self.bg, (C.WIDTH, C.HEIGHT))
+            # cacheado: novos Worlds reaproveitam a mesma Surface
+            return ASSETS.get_image(BACKGROUND, (C.WIDTH, C.HEIGHT))
         except Exception:
-            self.bg = None  # fallback: será preenchido com cor sólida no draw
+            return None  # fallback: será preenchido com cor sólida no draw
 
 
     # --------------------------------------------------------
     # SISTEMA DE HORDAS
     # --------------------------------------------------------
     def update_wave_system(self, dt):
-        # Se não há UFOs, conta para próxima horda
-        if len(self.ufos) == 0:
+        # Se não há UFOs nem asteroides, conta para próxima horda
+        if len(self.ufos) == 0 and len(self.asteroids) == 0:
             self.wave_timer += dt
             if self.wave_timer >= self.time_between_waves:
                 self.start_next_wave()
@@ -85,32 +148,40 @@ class World:
         self.wave_timer = 0
 
         # Aumenta dificuldade
-        self.ufo_spawn_rate += 0.006
-        self.ufo_speed_mult += 0.15
+        self.ufo_spawn_rate += C.UFO_SPAWN_RATE_STEP
+        self.ufo_speed_mult += C.UFO_SPEED_STEP
 
         # Spawn inicial de UFO com base na horda
         initial = min(4, self.wave)
         for _ in range(initial):
             self.spawn_ufo()
+        self.spawn_asteroids()
 
-        print(f"--- Horda {self.wave} iniciada ---")
+        if not self.headless:
+            print(f"--- Horda {self.wave} iniciada ---")
         
 
 
+    # --------------------------------------------------------
+    # ASTEROIDES — grandes nas bordas, longe da nave
+    # --------------------------------------------------------
+    def spawn_asteroids(self):
+        n = C.AST_WAVE_START + (self.wave - 1) * C.AST_WAVE_STEP
+        pos = np.array([tuple(rand_edge_pos(self.rng)) for _ in range(n)], np.float32)
+        self.asteroids.spawn_many(pos.reshape(-1, 2), 0)
+
     # --------------------------------------------------------
     # UFO — sempre pequeno
     # --------------------------------------------------------
     def spawn_ufo(self):
-        import random
         small = True  
-        y = uniform(0, C.HEIGHT)
-        x_left = random.random() < 0.5
+        y = self.rng.uniform(0, C.HEIGHT)
+        x_left = self.rng.random() < 0.5
         x = 0 if x_left else C.WIDTH
 
         # NOTE: a classe UFO deve aceitar (pos, small) ou (pos, small=True)
-        ufo = UFO(Vec(x, y), small=True)
+        ufo = UFO(Vec(x, y), small=True, headless=self.headless)
         ufo.dir = Vec(1, 0) if x_left else Vec(-1, 0)
-        ufo.shoot_cool = 0.0
 
         # Aumenta velocidade proporcional à horda
         ufo.speed = C.UFO_SPEED * self.ufo_speed_mult
@@ -125,13 +196,11 @@ class World:
     # Tiro do jogador
     # --------------------------------------------------------
     def try_fire(self):
-        if len(self.bullets) >= C.MAX_BULLETS:
+        if self.bullets.count_owner(OWNER_SHIP) >= C.MAX_BULLETS:
             return
 
-        b = self.ship.fire()
-        if b:
-            self.bullets.add(b)
-            self.all_sprites.add(b)
+        pos, vel = self.ship.fire()
+        if self.bullets.spawn(pos, vel, OWNER_SHIP):
             self.sound.play_player_shoot()
 
     # --------------------------------------------------------
@@ -144,18 +213,19 @@ class World:
 
         # Teleporta para posição aleatória
         self.ship.pos.xy = (
-            random.uniform(0, C.WIDTH),
-            random.uniform(0, C.HEIGHT)
+            self.rng.uniform(0, C.WIDTH),
+            self.rng.uniform(0, C.HEIGHT)
         )
 
-        # zera velocidade
+        # zera velocidade (e não interpola o salto)
         self.ship.vel.xy = (0, 0)
+        self.ship.prev_pos.update(self.ship.pos)
 
         # invulnerável por 1 segundo
-        self.ship.invuln = 1.0
+        self.ship.invuln = C.HYPERSPACE_INVULN
 
         # cooldown de 10 segundos
-        self.hyperspace_cd = 10.0
+        self.hyperspace_cd = C.HYPERSPACE_COOLDOWN
 
         # som opcional
         if hasattr(self.sound, "play_hyperspace"):
@@ -163,137 +233,219 @@ class World:
 
 
 
+    # --------------------------------------------------------
+    # ENTRADA (um InputFrame por passo de simulação)
+    # --------------------------------------------------------
+    def apply_input(self, inp):
+        # RT/D-pad ↑ chegam à nave pelo próprio InputFrame (como seta ↑)
+        if inp.fire:
+            self.try_fire()
+        if inp.hyper:
+            self.hyperspace()
+
+    def step(self, dt, inp):
+        self.apply_input(inp)
+        self.update(dt, inp)
+
     # --------------------------------------------------------
     # UPDATE
     # --------------------------------------------------------
     def update(self, dt: float, keys):
+        # guarda o estado anterior para o draw interpolar
+        self.step_dt = dt
+        for spr in self.all_sprites:
+            spr.prev_pos.update(spr.pos)
+
+        # cada subsistema roda na sua taxa (ver add_subsystems)
+        self.keys = keys
+        self.scheduler.run(dt, self.profiler)
+
+    def add_subsystems(self):
+        """Registra os subsistemas do passo, na ordem em que rodam.
+
+        Taxas em C.SUBSYSTEM_HZ; os ausentes rodam em todo passo.
+        """
+        hz = C.SUBSYSTEM_HZ.get
+        sched = self.scheduler
+        sched.add("ship", self.update_ship, hz("ship"))
+        sched.add("physics", self.update_physics, hz("physics"))
+        sched.add("animation", self.update_animation, hz("animation"))
+        sched.add("ufo_ai", self.update_ufo_ai, hz("ufo_ai"))
+        sched.add("waves", self.update_waves, hz("waves"))
+        sched.add("ufo_shots", lambda dt: self.update_ufo_shots(), hz("ufo_shots"))
+        sched.add("collisions", lambda dt: self.handle_collisions(), hz("collisions"))
+
+    def update_ship(self, dt):
         # passar controle para a ship (ela lida com entrada básica)
-        self.ship.control(keys, dt)
+        self.ship.control(self.keys, dt)
 
         # Cooldown do hiperespaço
         if hasattr(self, "hyperspace_cd") and self.hyperspace_cd > 0:
             self.hyperspace_cd -= dt
 
-        # atualizar todos sprites (Ship e UFOs animados devem ter update)
-        self.all_sprites.update(dt)
-
-        # thrust via RT/dpad -> Ship tem método thrust()
-        if self.rt_accel or self.dpad_up:
-            # Ship deve definir thrust() — caso não tenha, use vel increment
-            if hasattr(self.ship, "thrust"):
-                self.ship.thrust()
-            else:
-                # fallback simples: empurra na direção atual
-                try:
-                    dirv = Vec(math.cos(math.radians(self.ship.angle)),
-                               math.sin(math.radians(self.ship.angle)))
-                    self.ship.vel += dirv * (C.SHIP_THRUST * dt)
-                except Exception:
-                    pass
-
-        # UFO behavior: perseguir e ajustar velocidade
-        for ufo in self.ufos:
-            to_ship = self.ship.pos - ufo.pos
-            if to_ship.length() > 0:
-                ufo.dir = to_ship.normalize()
-            ufo.speed = C.UFO_SPEED * self.ufo_speed_mult
-
         # Invulnerabilidade inicial do spawn
         if self.safe > 0:
             self.safe -= dt
             self.ship.invuln = 0.5
 
+    def update_physics(self, dt):
+        # movimento de sprites (UFOs), tiros, asteroides e partículas
+        self.all_sprites.update(dt)
+        self.bullets.update(dt)
+        self.asteroids.update(dt)
+        self.particles.update(dt)
+
+    def update_animation(self, dt):
+        for spr in self.all_sprites:
+            spr.animate(dt)
+
+    def update_waves(self, dt):
         # Timer para spawn de UFO random
         self.ufo_timer -= dt
         if self.ufo_timer <= 0:
             # probabilidade por frame aumentada conforme wave
-            if random.random() < self.ufo_spawn_rate:
+            if self.rng.random() < self.ufo_spawn_rate:
                 self.spawn_ufo()
             self.ufo_timer = C.UFO_SPAWN_EVERY
 
         # Sistema de waves
         self.update_wave_system(dt)
 
-        # tiros de UFO
-        self.update_ufo_shots(dt)
 
-        # colisões (mantém bullets x UFO e UFO x player)
-        self.handle_collisions()
 
+    # --------------------------------------------------------
+    # UFO AI (todos os UFOs de uma vez)
+    # --------------------------------------------------------
+    def update_ufo_ai(self, dt):
+        ufos = self.ufos.sprites()
+        if not ufos:
+            self.ufo_shots = None
+            return
 
+        pos = np.array([(u.pos.x, u.pos.y) for u in ufos], np.float32)
+        cool = np.array([u.shoot_cool for u in ufos], np.float32)
+
+        # UFO atira mais rápido conforme wave
+        reload = max(C.UFO_RELOAD_MIN, C.UFO_RELOAD_BASE - self.wave * C.UFO_RELOAD_STEP)
+        dirs, steer, fire = steer_and_fire(pos, cool, (self.ship.pos.x, self.ship.pos.y),
+                                           dt, reload)
+
+        speed = C.UFO_SPEED * self.ufo_speed_mult
+        for ufo, d, s, c in zip(ufos, dirs.tolist(), steer.tolist(), cool.tolist()):
+            if s:
+                ufo.dir.xy = d
+            ufo.speed = speed
+            ufo.shoot_cool = c
+
+        if fire.any():
+            self.ufo_shots = (pos[fire], dirs[fire] * C.UFO_BULLET_SPEED)
+        else:
+            self.ufo_shots = None
 
     # --------------------------------------------------------
     # UFO Shots
     # --------------------------------------------------------
-    def update_ufo_shots(self, dt):
-        for ufo in self.ufos:
-            ufo.shoot_cool = getattr(ufo, "shoot_cool", 0.0) - dt
-
-            if ufo.shoot_cool <= 0:
-                # mira na ship
-                if (self.ship.pos - ufo.pos).length() > 0:
-                    dirv = (self.ship.pos - ufo.pos).normalize()
-                else:
-                    dirv = Vec(0, -1)
-
-                vel = dirv * C.SHIP_BULLET_SPEED
-                b = Bullet(ufo.pos, vel)
-                self.ufo_bullets.add(b)
-                self.all_sprites.add(b)
+    def update_ufo_shots(self):
+        if self.ufo_shots is None:
+            return
 
-                self.sound.play_ufo_shoot()
-                
-                # UFO atira mais rápido conforme wave
-                ufo.shoot_cool = max(0.35, 1.4 - self.wave * 0.1)
+        pos, vel = self.ufo_shots
+        self.ufo_shots = None
+        for _ in range(self.bullets.spawn_many(pos, vel, OWNER_UFO)):
+            self.sound.play_ufo_shoot()
 
 
 
     # --------------------------------------------------------
     # COLLISIONS
     # --------------------------------------------------------
-    def handle_collisions(self):
+    def collision_pairs(self):
+        """Reconstrói a grade e retorna os pares em colisão por categoria."""
+        grid = self.grid
+        grid.clear()
+
+        ship = self.ship
+        grid.insert("ship", ship, ship.pos.x, ship.pos.y, ship.r)
+        for ufo in self.ufos:
+            grid.insert("ufo", ufo, ufo.pos.x, ufo.pos.y, ufo.r)
 
-        # Player versus UFO
+        b = self.bullets
+        owner = b.owner[:b.count]
+        for category, who in (("bullet", OWNER_SHIP), ("ufo_bullet", OWNER_UFO)):
+            idx = np.flatnonzero(owner == who)
+            grid.insert_many(category, idx.tolist(), b.pos[idx], C.BULLET_RADIUS)
+        self.asteroids.index(grid)
+
+        return {
+            "bullet_ufo": grid.pairs("bullet", "ufo"),
+            "ufo_ship": grid.pairs("ufo", "ship"),
+            "bullet_ship": grid.pairs("ufo_bullet", "ship"),
+        }
+
+    def handle_collisions(self):
+        pairs = self.collision_pairs()
+        dead_bullets = set()
+
+        # Player mata UFO (cada tiro e cada UFO contam uma vez)
+        for bi, ufo in pairs["bullet_ufo"]:
+            if bi in dead_bullets or not ufo.alive():
+                continue
+            dead_bullets.add(bi)
+            self.score += C.UFO_SMALL["score"]
+            ufo.hit_timer = 0.15
+            ufo.kill()
+            self.sound.play_ufo_death()
+
+        # tiros (da nave e dos UFOs) contra asteroides, em lote
+        self.shoot_asteroids(dead_bullets)
+
+        # Player versus UFO / tiros de UFO / asteroides
         if self.ship.invuln <= 0 and self.safe <= 0:
-            for ufo in list(self.ufos):
-                if (ufo.pos - self.ship.pos).length() < (ufo.r + self.ship.r):
+            if any(ufo.alive() for ufo, _ in pairs["ufo_ship"]):
+                self.ship_die()
+            elif pairs["bullet_ship"]:
+                dead_bullets.add(pairs["bullet_ship"][0][0])
+                self.ship_die()
+            else:
+                ship = np.array([[self.ship.pos.x, self.ship.pos.y]], np.float32)
+                _, rocks = self.asteroids.hits(self.grid, ship, self.ship.r)
+                if len(rocks):
+                    self.asteroids.split(rocks)
                     self.ship_die()
-                    break
 
-            for b in list(self.ufo_bullets):
-                if (b.pos - self.ship.pos).length() < (b.r + self.ship.r):
-                    b.kill()
-                    self.ship_die()
-                    break
+        self.bullets.kill(list(dead_bullets))
+
+    def shoot_asteroids(self, dead_bullets):
+        b = self.bullets
+        live = np.ones(b.count, bool)
+        live[list(dead_bullets)] = False
+        idx = np.flatnonzero(live)
+        shots, rocks = self.asteroids.hits(self.grid, b.pos[idx], C.BULLET_RADIUS)
+        if len(shots) == 0:
+            return
+
+        shots = idx[shots]
+        dead_bullets.update(shots.tolist())
+        by_ship = b.owner[shots] == OWNER_SHIP
+        self.score += int(AST_SCORE[self.asteroids.size[np.unique(rocks[by_ship])]].sum())
 
-        # Player mata UFO
-        for ufo in list(self.ufos):
-            for b in list(self.bullets):
-                if (ufo.pos - b.pos).length() < (ufo.r + b.r):
-                    self.score += C.UFO_SMALL["score"]
-                    ufo.hit_timer = 0.15
-                    ufo.kill()
-                    b.kill()
-                    self.sound.play_ufo_death()
+        pos, size = self.asteroids.split(rocks)
+        self.asteroids.index(self.grid)  # as linhas mudaram com a divisão
+        for (x, y), s in zip(pos.tolist(), size.tolist()):
+            self.spawn_explosion((x, y), amount=int(AST_RADIUS[s]) // 2, decorative=True)
+            self.sound.play_asteroid_explosion()
 
 
     # --------------------------------------------------------
     # EXPLOSÃO (usa partículas)
     # --------------------------------------------------------
-    def spawn_explosion(self, pos, amount=30):
-        for _ in range(amount):
-            angle = random.uniform(0, math.tau)
-            speed = random.uniform(50, 200)
-
-            vel = Vec(math.cos(angle), math.sin(angle)) * speed
-
-            # NOVO: radius + ttl
-            radius = random.uniform(2, 4)
-            ttl = random.uniform(0.4, 0.9)
-
-            p = Particle(pos.xy, vel, radius, ttl)
-            self.particles.add(p)
-            self.all_sprites.add(p)
+    def spawn_explosion(self, pos, amount=30, decorative=False):
+        # decorative: detrito de asteroide, cortado primeiro quando o frame pesa
+        q = self.quality
+        if decorative and not q.effects:
+            return
+        amount = max(1, int(amount * q.particles))
+        self.particles.emit(pos, amount, speed=(50, 200), size=(2, 4), ttl=(0.4, 0.9))
 
 
     # --------------------------------------------------------
@@ -307,6 +459,7 @@ class World:
         if self.lives > 0:
             self.ship.pos.xy = (C.WIDTH / 2, C.HEIGHT / 2)
             self.ship.vel.xy = (0, 0)
+            self.ship.prev_pos.update(self.ship.pos)
             # garantir ângulo consistente se usar sprite animada
             if hasattr(self.ship, "angle"):
                 self.ship.angle = -90
@@ -322,32 +475,66 @@ class World:
     # --------------------------------------------------------
     # DRAW
     # --------------------------------------------------------
-    def draw(self, surf: pg.Surface, font: pg.font.Font):
-        # desenha background (fallback para cor sólida)
-        if self.bg:
-            surf.blit(self.bg, (0, 0))
+    def draw(self, surf: pg.Surface, font: pg.font.Font, alpha: float = 1.0):
+        """Desenha o frame inteiro; retorna os retângulos tocados."""
+        self.draw_background(surf)
+        return self.draw_entities(surf, font, alpha)
+
+    def draw_background(self, surf: pg.Surface, rect=None):
+        # desenha background (fallback para cor sólida); rect = só essa área
+        if self.bg and self.quality.background:
+            if rect is None:
+                surf.blit(self.bg, (0, 0))
+            else:
+                surf.blit(self.bg, rect, rect)
         else:
-            surf.fill(C.BLACK)
+            surf.fill(C.BLACK, rect)
+
+    def draw_entities(self, surf: pg.Surface, font: pg.font.Font, alpha: float = 1.0):
+        # alpha: fração do passo de simulação já acumulada (0..1)
+        lag = (1.0 - alpha) * self.step_dt
+        rects = []
 
-        # desenha todos sprites (Ship, UFOs, Bullets, Particles)
+        # desenha todos sprites (Ship, UFOs)
         for spr in self.all_sprites:
             # cada sprite deve implementar draw(surf)
             try:
-                spr.draw(surf)
+                rects.append(spr.draw(surf, alpha))
             except Exception:
                 # fallback: se for um sprite padrão, tenta blit image
                 if hasattr(spr, "image") and spr.image:
-                    surf.blit(spr.image, getattr(spr, "rect", spr.image.get_rect()))
+                    rects.append(surf.blit(spr.image, getattr(spr, "rect", spr.image.get_rect())))
                 else:
                     pass
 
-        # desenha HUD
-        txt = f"SCORE {self.score:06d}   LIVES {self.lives}   WAVE {self.wave}"
-        label = font.render(txt, True, C.WHITE)
-        surf.blit(label, (10, 10))
+        # asteroides, tiros e partículas em um único passe cada
+        self.asteroids.draw(surf, lag, rects)
+        self.bullets.draw(surf, lag, rects)
+        self.particles.draw(surf, lag, rects)
+
+        # desenha HUD (textos do cache; o score usa o atlas de dígitos)
+        rects.append(self.draw_hud(surf, font))
+
+        # qualidade reduzida pelo QualityGovernor
+        if self.quality.level:
+            rects.append(TEXT.draw(surf, font, f"QUALIDADE -{self.quality.level}", (10, 62)))
 
         # mostrar cooldown do hiperespaço, se existir
         if getattr(self, "hyperspace_cd", 0) > 0:
             cd_txt = f"HYPER COOLDOWN: {int(self.hyperspace_cd)}s"
-            cd_label = font.render(cd_txt, True, C.WHITE)
-            surf.blit(cd_label, (10, 36))
+            rects.append(TEXT.draw(surf, font, cd_txt, (10, 36)))
+
+        # visão de depuração da grade de colisão (F3)
+        if self.debug_grid:
+            self.grid.draw_debug(surf)
+            rects.append(surf.get_rect())
+
+        return rects
+
+    def draw_hud(self, surf, font):
+        """Linha ``SCORE 000000   LIVES n   WAVE n``; retorna o Rect ocupado."""
+        rect = TEXT.draw(surf, font, "SCORE ", (10, 10))
+        rect.union_ip(TEXT.draw_number(surf, font, self.score, rect.topright, 6))
+        rect.union_ip(TEXT.draw(surf, font, f"   LIVES {self.lives}   WAVE {self.wave}",
+                                rect.topright))
+        return rect
@@ -0,0 +1,25 @@
+import numpy as np
+
+
+def steer_and_fire(pos, cool, target, dt, reload):
+    """IA de todos os UFOs em um único passe vetorizado.
+
+    ``pos`` (N, 2) e ``cool`` (N,) são as posições e cooldowns de tiro;
+    ``target`` é a posição da nave. Retorna ``(dirs, steer, fire)``:
+    direções unitárias até a nave, máscara dos UFOs que têm direção
+    definida (distância > 0) e máscara dos que atiram neste frame.
+    ``cool`` é atualizado in-place (quem atira recarrega com ``reload``).
+    """
+    to_target = np.asarray(target, np.float32) - pos
+    dist = np.hypot(to_target[:, 0], to_target[:, 1])
+    steer = dist > 0
+
+    # sem direção (em cima da nave): mira para cima, como antes
+    dirs = np.empty_like(to_target)
+    dirs[:] = (0.0, -1.0)
+    dirs[steer] = to_target[steer] / dist[steer, None]
+
+    cool -= dt
+    fire = cool <= 0
+    cool[fire] = reload
+    return dirs, steer, fire
@@ -1,11 +1,12 @@
 
 import math
-from random import random, uniform
+import random
 from typing import Iterable, Tuple
 
 import pygame as pg
 
 import config as C
+from assets import TEXT
 
 Vec = pg.math.Vector2
 
@@ -14,23 +15,32 @@ def wrap_pos(pos: Vec) -> Vec:
     return Vec(pos.x % C.WIDTH, pos.y % C.HEIGHT)
 
 
+def lerp_wrap(prev: Vec, cur: Vec, alpha: float) -> Tuple[float, float]:
+    """Interpola entre dois estados; saltos (wrap, teleporte) não são interpolados."""
+    dx = cur.x - prev.x
+    dy = cur.y - prev.y
+    if abs(dx) > C.WIDTH / 2 or abs(dy) > C.HEIGHT / 2:
+        return cur.x, cur.y
+    return prev.x + dx * alpha, prev.y + dy * alpha
+
+
 def angle_to_vec(deg: float) -> Vec:
     rad = math.radians(deg)
     return Vec(math.cos(rad), math.sin(rad))
 
 
-def rand_unit_vec() -> Vec:
-    a = uniform(0, math.tau)
+def rand_unit_vec(rng: random.Random = random) -> Vec:
+    a = rng.uniform(0, math.tau)
     return Vec(math.cos(a), math.sin(a))
 
 
-def rand_edge_pos() -> Vec:
-    if random() < 0.5:
-        x = uniform(0, C.WIDTH)
-        y = 0 if random() < 0.5 else C.HEIGHT
+def rand_edge_pos(rng: random.Random = random) -> Vec:
+    if rng.random() < 0.5:
+        x = rng.uniform(0, C.WIDTH)
+        y = 0 if rng.random() < 0.5 else C.HEIGHT
     else:
-        x = 0 if random() < 0.5 else C.WIDTH
-        y = uniform(0, C.HEIGHT)
+        x = 0 if rng.random() < 0.5 else C.WIDTH
+        y = rng.uniform(0, C.HEIGHT)
     return Vec(x, y)
 
 
@@ -43,6 +53,5 @@ def draw_circle(surface: pg.Surface, pos: Vec, r: int):
 
 
 def text(surface: pg.Surface, font: pg.font.Font, s: str, x: int, y: int):
-    surf = font.render(s, True, C.WHITE)
-    rect = surf.get_rect(topleft=(x, y))
-    surface.blit(surf, rect)
+    # texto estático: renderizado uma vez e reaproveitado do cache
+    return TEXT.draw(surface, font, s, (x, y))
@@ -0,0 +1,547 @@
+"""K mundos avançando juntos em arrays NumPy empilhados.
+
+Mesmas regras de ``World.update``/``World.handle_collisions`` (nave,
+UFOs, tiros, asteroides, waves e colisões), mas sem sprites, som ou
+partículas, e com o RNG próprio (a mesma seed não refaz a mesma partida
+de um World). Um
+``step(actions)`` avança todos os mundos um passo fixo e devolve
+observações, recompensas e flags de fim. Mundos que terminam são
+reiniciados automaticamente. Feito para bots/RL.
+
+    batch = BatchWorld(256, seed=0)
+    obs = batch.reset()
+    obs, reward, done = batch.step(actions)   # actions: uint8[K], bits de inputs.py
+"""
+import math
+
+import numpy as np
+
+import config as C
+from asteroids import RADIUS as AST_RADIUS, SCORE as AST_SCORE, SPLIT as AST_SPLIT
+from inputs import FIRE, HYPER, LEFT, RIGHT, UP
+from scheduler import EPSILON
+
+OBS_UFOS = 4
+OBS_BULLETS = 4
+OBS_ASTEROIDS = 4
+OBS_SIZE = 8 + OBS_UFOS * 3 + OBS_BULLETS * 5 + OBS_ASTEROIDS * 4
+
+# subsistemas com taxa própria no World (config.SUBSYSTEM_HZ)
+RATED = ("ufo_ai", "waves")
+
+
+def alloc_slots(alive, need):
+    """Escolhe até ``need[k]`` slots livres em cada linha de ``alive``.
+
+    Retorna ``(linhas, slots, j)``: o j-ésimo slot alocado da linha.
+    """
+    maxn = int(need.max()) if need.size else 0
+    if maxn <= 0:
+        empty = np.empty(0, np.intp)
+        return empty, empty, empty
+    maxn = min(maxn, alive.shape[1])
+    order = np.argsort(alive, axis=1, kind="stable")[:, :maxn]  # livres primeiro
+    free = alive.shape[1] - alive.sum(axis=1)
+    j = np.arange(maxn)
+    ok = (j < need[:, None]) & (j < free[:, None])
+    rows, js = np.nonzero(ok)
+    return rows, order[rows, js], js
+
+
+def wrap_axis(d, size):
+    """Menor deslocamento num eixo do mundo toroidal (|d| < size)."""
+    d -= size * (d > size / 2)
+    d += size * (d < -size / 2)
+    return d
+
+
+def wrap_delta(d):
+    """Menor deslocamento 2D no mundo toroidal (como na grade de colisão)."""
+    wrap_axis(d[..., 0], C.WIDTH)
+    wrap_axis(d[..., 1], C.HEIGHT)
+    return d
+
+
+def wrap_pos(pos, bounds):
+    """Wrap-around in-place para quem andou menos de uma tela."""
+    pos += bounds * (pos < 0)
+    pos -= bounds * (pos >= bounds)
+
+
+class BatchWorld:
+    def __init__(self, k, seed=None, max_ufos=16, max_bullets=64, max_asteroids=128,
+                 max_steps=None):
+        self.k = k
+        self.u = max_ufos
+        self.b = max_bullets
+        self.a = max_asteroids
+        self.max_steps = max_steps
+        self.dt = np.float32(1 / C.SIM_HZ)
+        self.rng = np.random.default_rng(seed)
+        self.bounds = np.array([C.WIDTH, C.HEIGHT], np.float32)
+
+        f = np.float32
+        # nave
+        self.ship_pos = np.zeros((k, 2), f)
+        self.ship_vel = np.zeros((k, 2), f)
+        self.ship_angle = np.zeros(k, f)
+        self.invuln = np.zeros(k, f)
+        self.safe = np.zeros(k, f)
+        self.hyper_cd = np.zeros(k, f)
+        # estado do jogo
+        self.lives = np.zeros(k, np.int32)
+        self.score = np.zeros(k, np.int64)
+        self.wave = np.zeros(k, np.int32)
+        self.wave_timer = np.zeros(k, f)
+        self.ufo_timer = np.zeros(k, f)
+        self.spawn_rate = np.zeros(k, f)
+        self.speed_mult = np.zeros(k, f)
+        self.steps = np.zeros(k, np.int64)
+        # UFOs
+        self.ufo_alive = np.zeros((k, max_ufos), bool)
+        self.ufo_pos = np.zeros((k, max_ufos, 2), f)
+        self.ufo_dir = np.zeros((k, max_ufos, 2), f)
+        self.ufo_cool = np.zeros((k, max_ufos), f)
+        # tiros
+        self.bul_alive = np.zeros((k, max_bullets), bool)
+        self.bul_pos = np.zeros((k, max_bullets, 2), f)
+        self.bul_vel = np.zeros((k, max_bullets, 2), f)
+        self.bul_age = np.zeros((k, max_bullets), f)
+        self.bul_ufo = np.zeros((k, max_bullets), bool)  # dono: True = UFO
+        self.ufo_aim = np.zeros((k, max_ufos, 2), f)      # mira do último passo
+        # asteroides (tamanho: índice em config.AST_SIZES)
+        self.ast_alive = np.zeros((k, max_asteroids), bool)
+        self.ast_pos = np.zeros((k, max_asteroids, 2), f)
+        self.ast_vel = np.zeros((k, max_asteroids, 2), f)
+        self.ast_size = np.zeros((k, max_asteroids), np.intp)
+        # fase e dt desde a última chamada de cada subsistema, como no Scheduler
+        hz = [C.SUBSYSTEM_HZ.get(name) for name in RATED]
+        self.periods = [1 / h if h else 0.0 for h in hz]
+        self.rate_acc = np.zeros((len(RATED), k))
+        self.rate_since = np.zeros((len(RATED), k))
+
+        self.reset_worlds(np.ones(k, bool))
+
+    # ------------------------------------------------------------------
+    def reset(self):
+        self.reset_worlds(np.ones(self.k, bool))
+        return self.observe()
+
+    def reset_worlds(self, mask):
+        """Estado inicial de World.__init__ nos mundos marcados."""
+        self.ship_pos[mask] = (C.WIDTH / 2, C.HEIGHT / 2)
+        self.ship_vel[mask] = 0
+        self.ship_angle[mask] = 0
+        self.invuln[mask] = 0
+        self.safe[mask] = C.SAFE_SPAWN_TIME
+        self.hyper_cd[mask] = 0
+        self.lives[mask] = C.START_LIVES
+        self.score[mask] = 0
+        self.wave[mask] = 1
+        self.wave_timer[mask] = 0
+        self.ufo_timer[mask] = C.UFO_SPAWN_EVERY
+        self.spawn_rate[mask] = C.UFO_SPAWN_RATE
+        self.speed_mult[mask] = 1.0
+        self.steps[mask] = 0
+        self.ufo_alive[mask] = False
+        self.bul_alive[mask] = False
+        self.ast_alive[mask] = False
+        self.spawn_asteroids(np.where(mask, self.wave_asteroids(), 0))
+        self.rate_acc[:, mask] = 0
+        self.rate_since[:, mask] = 0
+
+    # ------------------------------------------------------------------
+    def step(self, actions):
+        actions = np.asarray(actions, np.uint8)
+        dt = self.dt
+        score_before = self.score.copy()
+        lives_before = self.lives.copy()
+
+        self.apply_input(actions)
+        self.move_ship(actions, dt)
+        self.hyper_cd[self.hyper_cd > 0] -= dt
+
+        # invulnerabilidade do spawn
+        safe = self.safe > 0
+        self.safe[safe] -= dt
+        self.invuln[safe] = 0.5
+
+        # sprites: invulnerabilidade, UFOs, tiros
+        np.maximum(self.invuln - dt, 0, out=self.invuln)
+        self.move_ufos(dt)
+        self.move_bullets(dt)
+        self.move_asteroids(dt)
+
+        # IA e waves só nos mundos em que o período venceu, com o dt acumulado
+        run, elapsed = self.due(0, dt)
+        fire = self.ufo_ai(elapsed, run)
+
+        run, elapsed = self.due(1, dt)
+        if run.any():
+            # spawn aleatório de UFO
+            self.ufo_timer -= elapsed
+            timer = run & (self.ufo_timer <= 0)
+            roll = self.rng.random(self.k) < self.spawn_rate
+            self.spawn_ufos((timer & roll).astype(np.intp))
+            self.ufo_timer[timer] = C.UFO_SPAWN_EVERY
+            self.update_waves(elapsed, run)
+
+        self.ufo_shots(fire)
+        self.collisions()
+
+        self.steps += 1
+        done = self.lives <= 0
+        if self.max_steps:
+            done |= self.steps >= self.max_steps
+
+        reward = (self.score - score_before) / C.UFO_SMALL["score"] \
+            - (lives_before - self.lives)
+        reward = reward.astype(np.float32)
+
+        if done.any():
+            self.reset_worlds(done)
+        return self.observe(), reward, done
+
+    def due(self, i, dt):
+        """Mundos em que o subsistema ``RATED[i]`` roda neste passo e o dt
+        de cada um desde a chamada anterior (mesma regra de Scheduler.run)."""
+        acc, since, period = self.rate_acc[i], self.rate_since[i], self.periods[i]
+        acc += dt
+        since += dt
+        run = acc + EPSILON >= period
+        acc[run] = np.where(acc[run] < 2 * period, acc[run] - period, 0.0)
+        elapsed = np.where(run, since, 0.0).astype(np.float32)
+        since[run] = 0.0
+        return run, elapsed
+
+    def ship_dir(self):
+        rad = np.radians(self.ship_angle)
+        return np.stack([np.cos(rad), -np.sin(rad)], axis=1)
+
+    def apply_input(self, actions):
+        fire = (actions & FIRE) != 0
+        shots = fire & (self.ship_shot_count() < C.MAX_BULLETS)
+        if shots.any():
+            d = self.ship_dir()
+            rows, slots, _ = alloc_slots(self.bul_alive, shots.astype(np.intp))
+            self.bul_alive[rows, slots] = True
+            self.bul_pos[rows, slots] = self.ship_pos[rows] + d[rows] * C.SHIP_MUZZLE
+            self.bul_vel[rows, slots] = d[rows] * C.SHIP_BULLET_SPEED
+            self.bul_age[rows, slots] = 0
+            self.bul_ufo[rows, slots] = False
+
+        hyper = ((actions & HYPER) != 0) & (self.hyper_cd <= 0)
+        n = int(hyper.sum())
+        if n:
+            self.ship_pos[hyper] = self.rng.uniform(0, 1, (n, 2)) * self.bounds
+            self.ship_vel[hyper] = 0
+            self.invuln[hyper] = C.HYPERSPACE_INVULN
+            self.hyper_cd[hyper] = C.HYPERSPACE_COOLDOWN
+
+    def ship_shot_count(self):
+        return (self.bul_alive & ~self.bul_ufo).sum(axis=1)
+
+    def move_ship(self, actions, dt):
+        left = (actions & LEFT) != 0
+        right = (actions & RIGHT) != 0
+        up = (actions & UP) != 0
+
+        self.ship_angle += C.SHIP_TURN_SPEED * dt * (left.astype(np.float32) - right)
+        self.ship_angle %= 360
+
+        self.ship_vel[up] += self.ship_dir()[up] * (C.SHIP_THRUST * dt)
+        speed = np.hypot(self.ship_vel[:, 0], self.ship_vel[:, 1])
+        fast = up & (speed > C.SHIP_MAX_SPEED)
+        self.ship_vel[fast] *= (C.SHIP_MAX_SPEED / speed[fast])[:, None]
+
+        self.ship_vel *= C.SHIP_FRICTION ** (dt * C.FPS)
+        self.ship_pos += self.ship_vel * dt
+        wrap_pos(self.ship_pos, self.bounds)
+
+    def move_ufos(self, dt):
+        speed = (C.UFO_SPEED * self.speed_mult * dt)[:, None, None]
+        self.ufo_pos += self.ufo_dir * speed * self.ufo_alive[:, :, None]
+        wrap_pos(self.ufo_pos, self.bounds)
+
+    def move_bullets(self, dt):
+        self.bul_pos += self.bul_vel * dt
+        wrap_pos(self.bul_pos, self.bounds)
+        self.bul_age += dt
+        self.bul_alive &= self.bul_age < C.BULLET_TTL
+
+    def ast_span(self, minimum=0):
+        """Colunas de asteroides em uso (os slots livres mais baixos são
+        ocupados primeiro, então os vivos ficam no começo)."""
+        used = np.flatnonzero(self.ast_alive.any(axis=0))
+        return max(minimum, int(used[-1]) + 1 if len(used) else 0)
+
+    def move_asteroids(self, dt):
+        a = self.ast_span()
+        pos = self.ast_pos[:, :a]
+        pos += self.ast_vel[:, :a] * dt * self.ast_alive[:, :a, None]
+        wrap_pos(pos, self.bounds)
+
+    def ufo_ai(self, dt, run):
+        """Mesma IA de ufo_ai.steer_and_fire, nos mundos ``run`` (``dt``
+        por mundo); retorna a máscara de tiro."""
+        active = self.ufo_alive & run[:, None]
+        to_ship = self.ship_pos[:, None, :] - self.ufo_pos
+        dist = np.hypot(to_ship[..., 0], to_ship[..., 1])
+        steer = active & (dist > 0)
+        aim = np.empty_like(to_ship)
+        aim[:] = (0.0, -1.0)
+        aim[steer] = to_ship[steer] / dist[steer][:, None]
+        self.ufo_dir[steer] = aim[steer]
+        self.ufo_aim = aim
+
+        self.ufo_cool -= dt[:, None] * active
+        fire = active & (self.ufo_cool <= 0)
+        reload = np.maximum(C.UFO_RELOAD_MIN, C.UFO_RELOAD_BASE - self.wave * C.UFO_RELOAD_STEP)
+        self.ufo_cool[fire] = np.broadcast_to(reload[:, None], fire.shape)[fire]
+        return fire
+
+    def spawn_ufos(self, count):
+        rows, slots, _ = alloc_slots(self.ufo_alive, count)
+        n = len(rows)
+        if n == 0:
+            return
+        left = self.rng.random(n) < 0.5
+        self.ufo_alive[rows, slots] = True
+        self.ufo_pos[rows, slots, 0] = np.where(left, 0, C.WIDTH)
+        self.ufo_pos[rows, slots, 1] = self.rng.uniform(0, C.HEIGHT, n)
+        self.ufo_dir[rows, slots, 0] = np.where(left, 1.0, -1.0)
+        self.ufo_dir[rows, slots, 1] = 0
+        self.ufo_cool[rows, slots] = 0
+
+    def wave_asteroids(self):
+        """Asteroides grandes do começo da wave atual (World.spawn_asteroids)."""
+        return C.AST_WAVE_START + (self.wave - 1) * C.AST_WAVE_STEP
+
+    def spawn_asteroids(self, count):
+        """``count[k]`` asteroides grandes nas bordas de cada mundo."""
+        rows, slots, _ = alloc_slots(self.ast_alive, count)
+        n = len(rows)
+        if n == 0:
+            return
+        # como utils.rand_edge_pos: uma borda ao acaso, posição ao longo dela
+        rng = self.rng
+        horizontal = rng.random(n) < 0.5
+        far = rng.random(n) < 0.5
+        t = rng.random(n)
+        pos = np.empty((n, 2), np.float32)
+        pos[:, 0] = np.where(horizontal, t * C.WIDTH, far * C.WIDTH)
+        pos[:, 1] = np.where(horizontal, far * C.HEIGHT, t * C.HEIGHT)
+        self.place_asteroids(rows, slots, pos, 0)
+
+    def place_asteroids(self, rows, slots, pos, size):
+        n = len(rows)
+        angle = self.rng.uniform(0, math.tau, n)
+        speed = self.rng.uniform(C.AST_VEL_MIN, C.AST_VEL_MAX, n)
+        self.ast_alive[rows, slots] = True
+        self.ast_pos[rows, slots] = pos
+        self.ast_vel[rows, slots, 0] = np.cos(angle) * speed
+        self.ast_vel[rows, slots, 1] = np.sin(angle) * speed
+        self.ast_size[rows, slots] = size
+
+    def split_asteroids(self, hit):
+        """Destroi os asteroides marcados em ``hit`` (K, A); filhos nascem no lugar."""
+        w, s = np.nonzero(hit)
+        if len(w) == 0:
+            return
+        pos = self.ast_pos[w, s]
+        size = self.ast_size[w, s]
+        self.ast_alive[w, s] = False
+
+        child_w, child_pos, child_size = [], [], []
+        for sz, children in enumerate(AST_SPLIT):
+            parent = size == sz
+            for c in children:
+                child_w.append(w[parent])
+                child_pos.append(pos[parent])
+                child_size.append(np.full(int(parent.sum()), c, np.intp))
+        if not child_w:
+            return
+        child_w = np.concatenate(child_w)
+        order = np.argsort(child_w, kind="stable")
+        need = np.bincount(child_w, minlength=self.k)
+        rows, slots, js = alloc_slots(self.ast_alive, need)
+        # j-ésimo slot da linha recebe o j-ésimo filho daquele mundo
+        idx = order[(np.cumsum(need) - need)[rows] + js]
+        self.place_asteroids(rows, slots, np.concatenate(child_pos)[idx],
+                             np.concatenate(child_size)[idx])
+
+    def update_waves(self, dt, run):
+        empty = ~self.ufo_alive.any(axis=1) & ~self.ast_alive.any(axis=1)
+        self.wave_timer[run & ~empty] = 0
+        self.wave_timer[run & empty] += dt[run & empty]
+        nxt = run & empty & (self.wave_timer >= C.WAVE_BREAK)
+        if not nxt.any():
+            return
+        self.wave[nxt] += 1
+        self.wave_timer[nxt] = 0
+        self.spawn_rate[nxt] += C.UFO_SPAWN_RATE_STEP
+        self.speed_mult[nxt] += C.UFO_SPEED_STEP
+        self.spawn_ufos(np.where(nxt, np.minimum(4, self.wave), 0))
+        self.spawn_asteroids(np.where(nxt, self.wave_asteroids(), 0))
+
+    def ufo_shots(self, fire):
+        need = fire.sum(axis=1)
+        rows, slots, js = alloc_slots(self.bul_alive, need)
+        if len(rows) == 0:
+            return
+        # j-ésimo tiro da linha vem do j-ésimo UFO que atirou
+        shooters = np.argsort(~fire, axis=1, kind="stable")[rows, js]
+        self.bul_alive[rows, slots] = True
+        self.bul_pos[rows, slots] = self.ufo_pos[rows, shooters]
+        self.bul_vel[rows, slots] = self.ufo_aim[rows, shooters] * C.UFO_BULLET_SPEED
+        self.bul_age[rows, slots] = 0
+        self.bul_ufo[rows, slots] = True
+
+    def collisions(self):
+        # tiros da nave x UFOs: cada tiro e cada UFO contam uma vez.
+        # A nave tem no máximo MAX_BULLETS tiros: compara só esses slots.
+        rows = np.arange(self.k)[:, None]
+        mine = self.bul_alive & ~self.bul_ufo
+        sel = np.argsort(~mine, axis=1, kind="stable")[:, :C.MAX_BULLETS]
+        valid = mine[rows, sel]
+        if valid.any():
+            bp = self.bul_pos[rows, sel]
+            dx = wrap_axis(bp[:, :, None, 0] - self.ufo_pos[:, None, :, 0], C.WIDTH)
+            dy = wrap_axis(bp[:, :, None, 1] - self.ufo_pos[:, None, :, 1], C.HEIGHT)
+            rr = (C.BULLET_RADIUS + C.UFO_SMALL["r"]) ** 2
+            hit = (dx * dx + dy * dy < rr) & valid[:, :, None] & self.ufo_alive[:, None, :]
+            if hit.any():
+                any_b = hit.any(axis=2)
+                target = np.where(any_b, hit.argmax(axis=2), -1)  # UFO de cada tiro
+                for_ufo = (target[:, :, None] == np.arange(self.u)) & any_b[:, :, None]
+                killed = for_ufo.any(axis=1)
+                shooter = for_ufo.argmax(axis=1)                   # 1º tiro de cada UFO
+                w, ufos = np.nonzero(killed)
+                self.ufo_alive[w, ufos] = False
+                self.bul_alive[w, sel[w, shooter[w, ufos]]] = False
+                self.score += killed.sum(axis=1) * C.UFO_SMALL["score"]
+
+        # tiros (da nave e dos UFOs) contra asteroides
+        self.shoot_asteroids()
+
+        vulnerable = (self.invuln <= 0) & (self.safe <= 0)
+        if not vulnerable.any():
+            return
+
+        d = wrap_delta(self.ufo_pos - self.ship_pos[:, None, :])
+        rr = (C.UFO_SMALL["r"] + C.SHIP_RADIUS) ** 2
+        by_ufo = (((d * d).sum(axis=-1) < rr) & self.ufo_alive).any(axis=1)
+
+        d = wrap_delta(self.bul_pos - self.ship_pos[:, None, :])
+        rr = (C.BULLET_RADIUS + C.SHIP_RADIUS) ** 2
+        shot = ((d * d).sum(axis=-1) < rr) & self.bul_alive & self.bul_ufo
+        by_bullet = shot.any(axis=1) & ~by_ufo
+
+        rows = np.flatnonzero(by_bullet & vulnerable)
+        self.bul_alive[rows, shot[rows].argmax(axis=1)] = False
+
+        # asteroides batidos pela nave se dividem, sem pontos
+        a = self.ast_span()
+        d = wrap_delta(self.ast_pos[:, :a] - self.ship_pos[:, None, :])
+        rr = (AST_RADIUS[self.ast_size[:, :a]] + C.SHIP_RADIUS) ** 2
+        rock = np.zeros_like(self.ast_alive)
+        rock[:, :a] = ((d * d).sum(axis=-1) < rr) & self.ast_alive[:, :a]
+        by_rock = rock.any(axis=1) & ~by_ufo & ~by_bullet & vulnerable
+        self.split_asteroids(rock & by_rock[:, None])
+
+        self.ship_die((by_ufo | by_bullet | by_rock) & vulnerable)
+
+    def shoot_asteroids(self):
+        # só os tiros vivos, cada um contra os asteroides do próprio mundo
+        w, b = np.nonzero(self.bul_alive)
+        span = self.ast_span()
+        if len(w) == 0 or span == 0:
+            return
+        d = wrap_delta(self.ast_pos[w, :span] - self.bul_pos[w, b][:, None, :])
+        rr = (AST_RADIUS[self.ast_size[w, :span]] + C.BULLET_RADIUS) ** 2
+        hit = ((d * d).sum(axis=-1) < rr) & self.ast_alive[w, :span]
+        any_hit = hit.any(axis=1)
+        if not any_hit.any():
+            return
+
+        # cada tiro destrói o primeiro asteroide que toca
+        w, b, a = w[any_hit], b[any_hit], hit[any_hit].argmax(axis=1)
+        self.bul_alive[w, b] = False
+        rocks = np.zeros_like(self.ast_alive)
+        rocks[w, a] = True
+        # pontos só pelos tiros da nave, uma vez por asteroide
+        mine = ~self.bul_ufo[w, b]
+        scored = np.zeros_like(self.ast_alive)
+        scored[w[mine], a[mine]] = True
+        self.score += (AST_SCORE[self.ast_size] * scored).sum(axis=1)
+        self.split_asteroids(rocks)
+
+    def ship_die(self, mask):
+        if not mask.any():
+            return
+        self.lives[mask] -= 1
+        alive = mask & (self.lives > 0)
+        self.ship_pos[alive] = (C.WIDTH / 2, C.HEIGHT / 2)
+        self.ship_vel[alive] = 0
+        self.ship_angle[alive] = -90 % 360
+        self.invuln[alive] = C.SAFE_SPAWN_TIME
+        self.safe[alive] = C.SAFE_SPAWN_TIME
+
+    # ------------------------------------------------------------------
+    def observe(self):
+        """Observação float32 (K, OBS_SIZE), normalizada pelo tamanho da tela.
+
+        Nave (pos, vel, sen/cos do ângulo, invulnerável, cooldown do hiper),
+        depois os OBS_UFOS UFOs, OBS_BULLETS tiros inimigos e OBS_ASTEROIDS
+        asteroides mais próximos em posição relativa (com flag de presença;
+        asteroides também com o raio).
+        """
+        k = self.k
+        scale = np.float32(1 / C.WIDTH)
+        obs = np.zeros((k, OBS_SIZE), np.float32)
+        rad = np.radians(self.ship_angle)
+        obs[:, 0:2] = self.ship_pos / self.bounds
+        obs[:, 2:4] = self.ship_vel / C.SHIP_MAX_SPEED
+        obs[:, 4] = np.sin(rad)
+        obs[:, 5] = np.cos(rad)
+        obs[:, 6] = (self.invuln > 0) | (self.safe > 0)
+        obs[:, 7] = self.hyper_cd / C.HYPERSPACE_COOLDOWN
+
+        rows = np.arange(k)[:, None]
+        col = 8
+        d = wrap_delta(self.ufo_pos - self.ship_pos[:, None, :])
+        near = self.nearest(d, self.ufo_alive, OBS_UFOS)
+        present = self.ufo_alive[rows, near]
+        obs[:, col:col + OBS_UFOS * 3] = np.concatenate(
+            [d[rows, near] * scale * present[..., None], present[..., None]], axis=2
+        ).reshape(k, -1)
+        col += OBS_UFOS * 3
+
+        enemy = self.bul_alive & self.bul_ufo
+        d = wrap_delta(self.bul_pos - self.ship_pos[:, None, :])
+        near = self.nearest(d, enemy, OBS_BULLETS)
+        present = enemy[rows, near][..., None]
+        obs[:, col:col + OBS_BULLETS * 5] = np.concatenate(
+            [d[rows, near] * scale * present,
+             self.bul_vel[rows, near] / C.UFO_BULLET_SPEED * present,
+             present], axis=2
+        ).reshape(k, -1)
+        col += OBS_BULLETS * 5
+
+        a = self.ast_span(OBS_ASTEROIDS)
+        d = wrap_delta(self.ast_pos[:, :a] - self.ship_pos[:, None, :])
+        near = self.nearest(d, self.ast_alive[:, :a], OBS_ASTEROIDS)
+        present = self.ast_alive[rows, near][..., None]
+        radius = AST_RADIUS[self.ast_size[rows, near]][..., None]
+        obs[:, col:] = np.concatenate(
+            [d[rows, near] * scale * present, radius * scale * present, present], axis=2
+        ).reshape(k, -1)
+        return obs
+
+    @staticmethod
+    def nearest(d, alive, n):
+        dist = np.where(alive, (d * d).sum(axis=-1), np.inf)
+        n = min(n, dist.shape[1])
+        idx = np.argpartition(dist, n - 1, axis=1)[:, :n]
+        order = np.take_along_axis(dist, idx, axis=1).argsort(axis=1)
+        return np.take_along_axis(idx, order, axis=1)